@@ -4,6 +4,7 @@ import os
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
@@ -12,7 +13,9 @@ from hyperlocal.config import RUNTIME_CONFIG
 from hyperlocal.db import init_db
 from hyperlocal.health import run_health_checks
 
-app = FastAPI(title="Hyperlocal API")
+# orjson renders the large run/variant payloads several times faster than
+# the default json-based response class.
+app = FastAPI(title="Hyperlocal API", default_response_class=ORJSONResponse)
 
 output_dir = Path("output")
 output_dir.mkdir(parents=True, exist_ok=True)
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 
-from hyperlocal.comfyui_provider import build_comfyui_config, generate_comfyui_image
+import httpx
+
+from hyperlocal.comfyui_provider import (
+    build_comfyui_config,
+    build_flyer_workflow_values,
+    download_comfyui_image,
+    render_comfyui_workflow_template,
+    submit_comfyui_workflow,
+    wait_for_comfyui_outputs,
+)
 from hyperlocal.config import MODEL_CONFIG, RUNTIME_CONFIG
 from hyperlocal.llm_providers import build_llm_clients
 from hyperlocal.openai_helpers import chat_json
@@ -14,7 +24,14 @@ from hyperlocal.schemas import BrandStyle, CopyVariant, CreativeBrief
 
 
 def timestamp() -> str:
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return time.strftime("%Y%m%d_%H%M%S")
+
+
+# Resolved once at import: Path.resolve() stats every path component, and these
+# never change for the lifetime of the process.
+_BACKEND_ROOT = Path(__file__).resolve().parents[1]
+_REPO_ROOT = _BACKEND_ROOT.parent
+_DEFAULT_WORKFLOW = str(_REPO_ROOT / "comfyui" / "workflows" / "flyer_ad_v1_template.json")
 
 
 @dataclass(frozen=True)
@@ -26,6 +43,10 @@ class ComfyFlyerSettings:
     sampler_name: str = "euler"
     scheduler: str = "normal"
     denoise: float = 1.0
+    # Reuse one background across variants: identical prompt + seed lets
+    # ComfyUI's node cache skip the diffusion stages after variant 1, so only
+    # the text-overlay nodes re-execute per copy variant.
+    reuse_background: bool = False
 
 
 @dataclass(frozen=True)
@@ -62,14 +83,11 @@ class ComfyFlyerPipeline:
 
         self.comfyui_api_url = comfyui_api_url or RUNTIME_CONFIG.comfyui_api_url
         # Resolve workflow path relative to repo root even when invoked from `backend/`.
-        backend_root = Path(__file__).resolve().parents[1]
-        repo_root = backend_root.parent
-        default_workflow = repo_root / "comfyui" / "workflows" / "flyer_ad_v1_template.json"
         if workflow_path:
             wf = Path(workflow_path)
-            self.workflow_path = str(wf if wf.is_absolute() else (repo_root / wf))
+            self.workflow_path = str(wf if wf.is_absolute() else (_REPO_ROOT / wf))
         else:
-            self.workflow_path = str(default_workflow)
+            self.workflow_path = _DEFAULT_WORKFLOW
         self.timeout = float(timeout if timeout is not None else RUNTIME_CONFIG.comfyui_timeout)
         self.output_node = output_node if output_node is not None else RUNTIME_CONFIG.comfyui_output_node
 
@@ -262,7 +280,7 @@ class ComfyFlyerPipeline:
 
         # Save run metadata for easy review.
         manifest = {
-            "created_at": datetime.now().isoformat(),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
             "pipeline": "ComfyFlyerPipeline",
             "comfyui_api_url": self.comfyui_api_url,
             "workflow_path": self.workflow_path,
@@ -275,6 +293,7 @@ class ComfyFlyerPipeline:
                 "sampler_name": settings.sampler_name,
                 "scheduler": settings.scheduler,
                 "denoise": settings.denoise,
+                "reuse_background": settings.reuse_background,
             },
             "text_model": MODEL_CONFIG.text_model,
             "business_block": business_block(brief),
@@ -284,43 +303,77 @@ class ComfyFlyerPipeline:
         (run_dir / "brand_style.json").write_text(json.dumps(style.model_dump(), indent=2) + "\n")
 
         images: list[str] = []
-        for idx, copy in enumerate(copies, start=1):
-            prompt = self.build_background_prompt(brief, style, copy, idx)
-            negative = (
-                "text, letters, words, numbers, logos, watermarks, labels, signage, "
-                "icons, diagrams, charts, UI, people, faces, hands, clutter"
-            )
-
-            prefix = f"variant_{idx:02d}"
-            (run_dir / f"{prefix}.prompt.txt").write_text(prompt + "\n")
-            (run_dir / f"{prefix}.negative.txt").write_text(negative + "\n")
-            (run_dir / f"{prefix}.copy.json").write_text(
-                json.dumps(copy.model_dump(), indent=2) + "\n"
-            )
-
-            # Provide workflow knobs via placeholders (flyer_full_template.json).
-            overrides = {
-                "CKPT_NAME": settings.ckpt_name,
-                "SEED": settings.seed + idx,
-                "STEPS": settings.steps,
-                "CFG": settings.cfg,
-                "SAMPLER_NAME": settings.sampler_name,
-                "SCHEDULER": settings.scheduler,
-                "DENOISE": settings.denoise,
-            }
-            image_path = run_dir / f"{prefix}.png"
-            generate_comfyui_image(
-                prompt=prompt,
-                negative_prompt=negative,
-                output_path=str(image_path),
-                config=config,
-                brief=brief,
-                style=style,
-                copy=copy,
-                workflow_overrides=overrides,
-                rendered_workflow_path=str(run_dir / f"{prefix}.workflow.json"),
-            )
-            images.append(str(image_path))
+        timeout = max(10.0, float(self.timeout))
+        with httpx.Client(timeout=timeout) as client, ThreadPoolExecutor(
+            max_workers=1
+        ) as downloads:
+            # Phase 1: submit every variant workflow up front. ComfyUI queues
+            # prompts server-side, so the backend starts on variant 2 the
+            # moment variant 1 finishes instead of waiting for our next poll
+            # cycle to submit it.
+            submitted: list[tuple[str, Path]] = []
+            for idx, copy in enumerate(copies, start=1):
+                prompt = self.build_background_prompt(
+                    brief, style, copy, 1 if settings.reuse_background else idx
+                )
+                negative = (
+                    "text, letters, words, numbers, logos, watermarks, labels, signage, "
+                    "icons, diagrams, charts, UI, people, faces, hands, clutter"
+                )
+
+                prefix = f"variant_{idx:02d}"
+                (run_dir / f"{prefix}.prompt.txt").write_text(prompt + "\n")
+                (run_dir / f"{prefix}.negative.txt").write_text(negative + "\n")
+                (run_dir / f"{prefix}.copy.json").write_text(
+                    json.dumps(copy.model_dump(), indent=2) + "\n"
+                )
+
+                # Provide workflow knobs via placeholders (flyer_full_template.json).
+                overrides = {
+                    "CKPT_NAME": settings.ckpt_name,
+                    "SEED": settings.seed if settings.reuse_background else settings.seed + idx,
+                    "STEPS": settings.steps,
+                    "CFG": settings.cfg,
+                    "SAMPLER_NAME": settings.sampler_name,
+                    "SCHEDULER": settings.scheduler,
+                    "DENOISE": settings.denoise,
+                }
+                values = build_flyer_workflow_values(
+                    prompt=prompt,
+                    negative_prompt=negative,
+                    config=config,
+                    brief=brief,
+                    style=style,
+                    copy=copy,
+                    workflow_overrides=overrides,
+                )
+                workflow = render_comfyui_workflow_template(config.workflow_path, values)
+                (run_dir / f"{prefix}.workflow.json").write_text(
+                    json.dumps(workflow, indent=2) + "\n"
+                )
+
+                prompt_id = submit_comfyui_workflow(client, config=config, workflow=workflow)
+                image_path = run_dir / f"{prefix}.png"
+                submitted.append((prompt_id, image_path))
+                images.append(str(image_path))
+
+            # Phase 2: wait for each queued prompt in submission order and
+            # download on a worker thread so the next variant keeps rendering
+            # while this PNG streams to disk.
+            pending: list[Future[str]] = []
+            for prompt_id, image_path in submitted:
+                outputs = wait_for_comfyui_outputs(client, config=config, prompt_id=prompt_id)
+                pending.append(
+                    downloads.submit(
+                        download_comfyui_image,
+                        client,
+                        config=config,
+                        outputs=outputs,
+                        output_path=str(image_path),
+                    )
+                )
+            for future in pending:
+                future.result()
 
         return ComfyFlyerRun(
             output_dir=str(run_dir),
@@ -4,6 +4,7 @@ import json
 import re
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -124,6 +125,7 @@ def _resolve_palette_hex(palette: list[str], fallback: str) -> str:
     return fallback
 
 
+@lru_cache(maxsize=1)
 def _default_font_path() -> str:
     candidates = [
         "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",
@@ -164,11 +166,61 @@ def _download_image(
         "subfolder": image_ref.get("subfolder", ""),
         "type": image_ref.get("type", "output"),
     }
-    resp = client.get(f"{api_url}/view", params=params)
-    resp.raise_for_status()
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "wb") as f:
-        f.write(resp.content)
+    # Stream to disk in chunks: overlaps the network read with the file write
+    # and avoids buffering the whole PNG in memory first.
+    with client.stream("GET", f"{api_url}/view", params=params) as resp:
+        resp.raise_for_status()
+        with open(output_path, "wb") as f:
+            for chunk in resp.iter_bytes(chunk_size=65536):
+                f.write(chunk)
+
+
+def submit_comfyui_workflow(
+    client: httpx.Client, *, config: ComfyUiConfig, workflow: dict[str, Any]
+) -> str:
+    """Queue a rendered workflow and return the ComfyUI prompt id."""
+    resp = client.post(f"{config.api_url}/prompt", json={"prompt": workflow})
+    resp.raise_for_status()
+    prompt_id = resp.json().get("prompt_id")
+    if not prompt_id:
+        raise RuntimeError("ComfyUI did not return a prompt_id")
+    return prompt_id
+
+
+def wait_for_comfyui_outputs(
+    client: httpx.Client, *, config: ComfyUiConfig, prompt_id: str
+) -> dict[str, Any]:
+    """Poll history until the queued prompt produces outputs (or times out)."""
+    deadline = time.time() + max(10.0, float(config.timeout))
+    while time.time() < deadline:
+        hist_resp = client.get(f"{config.api_url}/history/{prompt_id}")
+        if hist_resp.status_code == 200:
+            history = hist_resp.json().get(prompt_id)
+            if history:
+                outputs = history.get("outputs")
+                if outputs:
+                    return outputs
+        time.sleep(0.5)
+    raise RuntimeError("ComfyUI did not produce outputs before timeout")
+
+
+def download_comfyui_image(
+    client: httpx.Client,
+    *,
+    config: ComfyUiConfig,
+    outputs: dict[str, Any],
+    output_path: str,
+) -> str:
+    """Fetch the produced image to disk; safe to run on a worker thread."""
+    image_ref = _select_image_ref(outputs, config.output_node)
+    _download_image(
+        client,
+        api_url=config.api_url,
+        image_ref=image_ref,
+        output_path=output_path,
+    )
+    return output_path
 
 
 def generate_comfyui_background_image(
@@ -196,47 +248,25 @@ def generate_comfyui_background_image(
     workflow = _render_workflow_template(config.workflow_path, values)
     timeout = max(10.0, float(config.timeout))
     with httpx.Client(timeout=timeout) as client:
-        resp = client.post(f"{config.api_url}/prompt", json={"prompt": workflow})
-        resp.raise_for_status()
-        data = resp.json()
-        prompt_id = data.get("prompt_id")
-        if not prompt_id:
-            raise RuntimeError("ComfyUI did not return a prompt_id")
-        deadline = time.time() + timeout
-        outputs: dict[str, Any] | None = None
-        while time.time() < deadline:
-            hist_resp = client.get(f"{config.api_url}/history/{prompt_id}")
-            if hist_resp.status_code == 200:
-                history = hist_resp.json().get(prompt_id)
-                if history:
-                    outputs = history.get("outputs")
-                    if outputs:
-                        break
-            time.sleep(0.5)
-        if not outputs:
-            raise RuntimeError("ComfyUI did not produce outputs before timeout")
-        image_ref = _select_image_ref(outputs, config.output_node)
-        _download_image(
-            client,
-            api_url=config.api_url,
-            image_ref=image_ref,
-            output_path=output_path,
+        prompt_id = submit_comfyui_workflow(client, config=config, workflow=workflow)
+        outputs = wait_for_comfyui_outputs(client, config=config, prompt_id=prompt_id)
+        download_comfyui_image(
+            client, config=config, outputs=outputs, output_path=output_path
         )
     return ImageResult(path=output_path, revised_prompt=None)
 
 
-def generate_comfyui_image(
+def build_flyer_workflow_values(
     *,
     prompt: str,
     negative_prompt: str,
-    output_path: str,
     config: ComfyUiConfig,
     brief: CreativeBrief,
     style: BrandStyle,
     copy: CopyVariant,
     workflow_overrides: dict[str, Any] | None = None,
-    rendered_workflow_path: str | None = None,
-) -> ImageResult:
+) -> dict[str, Any]:
+    """Assemble the placeholder values for the flyer workflow template."""
     palette_items = style.palette or brief.brand_colors or []
     palette = ", ".join(palette_items)
     style_keywords = ", ".join(style.style_keywords or brief.style_keywords or [])
@@ -273,36 +303,39 @@ def generate_comfyui_image(
     if workflow_overrides:
         # Allow workflows to accept additional knobs like CKPT_NAME, STEPS, CFG, SEED, etc.
         values.update(workflow_overrides)
+    return values
+
+
+def generate_comfyui_image(
+    *,
+    prompt: str,
+    negative_prompt: str,
+    output_path: str,
+    config: ComfyUiConfig,
+    brief: CreativeBrief,
+    style: BrandStyle,
+    copy: CopyVariant,
+    workflow_overrides: dict[str, Any] | None = None,
+    rendered_workflow_path: str | None = None,
+) -> ImageResult:
+    values = build_flyer_workflow_values(
+        prompt=prompt,
+        negative_prompt=negative_prompt,
+        config=config,
+        brief=brief,
+        style=style,
+        copy=copy,
+        workflow_overrides=workflow_overrides,
+    )
     workflow = _render_workflow_template(config.workflow_path, values)
     if rendered_workflow_path:
         Path(rendered_workflow_path).parent.mkdir(parents=True, exist_ok=True)
         Path(rendered_workflow_path).write_text(json.dumps(workflow, indent=2) + "\n")
     timeout = max(10.0, float(config.timeout))
     with httpx.Client(timeout=timeout) as client:
-        resp = client.post(f"{config.api_url}/prompt", json={"prompt": workflow})
-        resp.raise_for_status()
-        data = resp.json()
-        prompt_id = data.get("prompt_id")
-        if not prompt_id:
-            raise RuntimeError("ComfyUI did not return a prompt_id")
-        deadline = time.time() + timeout
-        outputs: dict[str, Any] | None = None
-        while time.time() < deadline:
-            hist_resp = client.get(f"{config.api_url}/history/{prompt_id}")
-            if hist_resp.status_code == 200:
-                history = hist_resp.json().get(prompt_id)
-                if history:
-                    outputs = history.get("outputs")
-                    if outputs:
-                        break
-            time.sleep(0.5)
-        if not outputs:
-            raise RuntimeError("ComfyUI did not produce outputs before timeout")
-        image_ref = _select_image_ref(outputs, config.output_node)
-        _download_image(
-            client,
-            api_url=config.api_url,
-            image_ref=image_ref,
-            output_path=output_path,
+        prompt_id = submit_comfyui_workflow(client, config=config, workflow=workflow)
+        outputs = wait_for_comfyui_outputs(client, config=config, prompt_id=prompt_id)
+        download_comfyui_image(
+            client, config=config, outputs=outputs, output_path=output_path
         )
     return ImageResult(path=output_path, revised_prompt=None)
@@ -1,15 +1,40 @@
 from __future__ import annotations
 
 import os
+
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 
-def build_engine(database_url: str | None = None):
+def _json_serializer(value) -> str:
+    # orjson beats stdlib json on the nested brief/style payloads and
+    # handles datetimes natively; SQLAlchemy expects str, not bytes.
+    return orjson.dumps(value).decode()
+
+
+def build_engine(database_url: str | None = None, *, readonly: bool = False):
     url = database_url or os.getenv("DATABASE_URL")
     if not url:
         raise RuntimeError("DATABASE_URL is not set")
-    return create_engine(url, pool_pre_ping=True)
+    kwargs: dict = {
+        # Pre-ping costs one round trip per checkout; deployments with a
+        # reliable local database can switch it off.
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "1") == "1",
+        "json_serializer": _json_serializer,
+        "json_deserializer": orjson.loads,
+    }
+    if url.startswith("postgresql"):
+        # Pool sizing only applies to server databases; SQLite's default pool
+        # does not accept these kwargs. pool_recycle keeps checkouts ahead of
+        # server-side idle timeouts. Read-mostly scripts can ask for a small
+        # pool instead of the write-path defaults.
+        kwargs.update(
+            pool_size=2 if readonly else int(os.getenv("DB_POOL_SIZE", "10")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        )
+    return create_engine(url, **kwargs)
 
 
 def init_db(database_url: str | None = None):
@@ -22,4 +47,8 @@ def init_db(database_url: str | None = None):
 
 def build_sessionmaker(database_url: str | None = None):
     engine = build_engine(database_url)
-    return sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    # expire_on_commit=False keeps returned rows readable (ids, indexes)
+    # after their session commits and closes, instead of forcing a refresh.
+    return sessionmaker(
+        bind=engine, autoflush=False, autocommit=False, expire_on_commit=False
+    )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 from openai import OpenAI
 
@@ -20,6 +21,7 @@ class LLMClients:
     vision_base_url: str
 
 
+@lru_cache(maxsize=None)
 def _normalize_provider(provider: str) -> str:
     provider = provider.strip().lower().replace("-", "_")
     return provider or "ollama"
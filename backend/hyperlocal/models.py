@@ -7,6 +7,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
@@ -14,6 +15,7 @@ from sqlalchemy import (
     UniqueConstraint,
     func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -21,15 +23,26 @@ class Base(DeclarativeBase):
     pass
 
 
+# jsonb on Postgres (binary storage, indexable, no re-parse on read);
+# plain JSON elsewhere. Serialization itself goes through the orjson
+# codec configured on the engine.
+_JSON_TYPE = JSON().with_variant(JSONB(), "postgresql")
+
+
 class CreativeRun(Base):
     __tablename__ = "creative_runs"
+    __table_args__ = (
+        # GIN makes containment filters on the brief index-assisted; other
+        # dialects ignore the postgresql_using kwarg and build a plain index.
+        Index("ix_runs_brief_gin", "brief_json", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     campaign_id: Mapped[Optional[int]] = mapped_column(Integer, index=True, nullable=True)
     status: Mapped[str] = mapped_column(String(32), index=True, default="RUNNING")
-    brief_json: Mapped[dict] = mapped_column(JSON, default=dict)
-    brand_style_json: Mapped[dict] = mapped_column(JSON, default=dict)
-    model_versions_json: Mapped[dict] = mapped_column(JSON, default=dict)
+    brief_json: Mapped[dict] = mapped_column(_JSON_TYPE, default=dict)
+    brand_style_json: Mapped[dict] = mapped_column(_JSON_TYPE, default=dict)
+    model_versions_json: Mapped[dict] = mapped_column(_JSON_TYPE, default=dict)
     error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     created_at: Mapped[str] = mapped_column(
@@ -48,13 +61,15 @@ class CreativeVariant(Base):
     __tablename__ = "creative_variants"
     __table_args__ = (
         UniqueConstraint("run_id", "variant_index", name="uq_run_variant"),
+        # Serves "passing variants for a run" without scanning every variant.
+        Index("ix_variants_run_qc", "run_id", "qc_passed"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     run_id: Mapped[int] = mapped_column(ForeignKey("creative_runs.id"), index=True)
     variant_index: Mapped[int] = mapped_column(Integer)
 
-    copy_json: Mapped[dict] = mapped_column(JSON, default=dict)
+    copy_json: Mapped[dict] = mapped_column(_JSON_TYPE, default=dict)
     prompt_text: Mapped[str] = mapped_column(Text)
     negative_prompt: Mapped[str] = mapped_column(Text)
     image_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -75,6 +90,11 @@ class CreativeVariant(Base):
 
 class CreativeAsset(Base):
     __tablename__ = "creative_assets"
+    __table_args__ = (
+        # "Recent assets per campaign": the btree satisfies the created_at
+        # ordering in either direction within a campaign prefix.
+        Index("ix_assets_campaign_created", "campaign_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     campaign_id: Mapped[int] = mapped_column(Integer, index=True)
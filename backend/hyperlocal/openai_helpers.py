@@ -4,6 +4,7 @@ import base64
 import json
 import ast
 import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
@@ -35,6 +36,23 @@ def image_url_from_path(image_path: str, mime: str = "image/png") -> str:
     return f"data:{mime};base64,{encode_image_data(image_path)}"
 
 
+# Multiple of 4 so every slice is a self-contained base64 quantum.
+_B64_CHUNK = 256 * 1024
+
+
+def write_b64_image(image_b64: str, output_path: str) -> None:
+    """
+    Decode a base64 image payload to disk in chunks.
+
+    Generated 6x9 renders run to several MB; decoding slice by slice avoids
+    holding a second full-size bytes buffer next to the encoded string.
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "wb") as f:
+        for start in range(0, len(image_b64), _B64_CHUNK):
+            f.write(base64.b64decode(image_b64[start : start + _B64_CHUNK]))
+
+
 def chat_content(
     client: OpenAI, model: str, messages: list[dict[str, Any]]
 ) -> str:
@@ -45,6 +63,31 @@ def chat_content(
 CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
 
 
+def _parse_array_prefix(content: str, start: int):
+    """
+    Incrementally decode items from an array that may be truncated mid-stream.
+
+    Long model responses routinely get cut off at the token limit; decoding
+    element by element salvages every complete leading item instead of
+    discarding the whole response.
+    """
+    decoder = json.JSONDecoder()
+    items = []
+    idx = start + 1
+    length = len(content)
+    while idx < length:
+        while idx < length and content[idx] in ", \t\r\n":
+            idx += 1
+        if idx >= length or content[idx] == "]":
+            break
+        try:
+            obj, idx = decoder.raw_decode(content, idx)
+        except json.JSONDecodeError:
+            break
+        items.append(obj)
+    return items or None
+
+
 def _parse_json_like(content: str):
     content = content.strip()
     content = content.replace("```json", "").replace("```", "").strip()
@@ -52,6 +95,16 @@ def _parse_json_like(content: str):
     try:
         return json.loads(content)
     except json.JSONDecodeError:
+        # If the payload is an array, salvage its complete leading items before
+        # falling back to coarser repairs.
+        for idx, ch in enumerate(content):
+            if ch == "[":
+                salvaged = _parse_array_prefix(content, idx)
+                if salvaged is not None:
+                    return salvaged
+                break
+            if ch == "{":
+                break
         decoder = json.JSONDecoder()
         for idx, ch in enumerate(content):
             if ch not in "{[":
@@ -101,6 +154,61 @@ def chat_json(
     raise json.JSONDecodeError("Failed to parse JSON from model output", content, 0)
 
 
+def chat_json_batch(
+    client: OpenAI,
+    model: str,
+    message_batches: list[list[dict[str, Any]]],
+    *,
+    poll_interval: float = 10.0,
+    timeout: float = 86400.0,
+) -> list[Any]:
+    """
+    Run several chat-completion requests through the OpenAI Batch API.
+
+    Requests are uploaded as one JSONL file and processed server-side at half
+    the synchronous price; we poll until the batch settles. Returns the parsed
+    JSON payload per request in input order (None where a request failed or
+    did not parse). Requires a backend that actually implements /v1/batches.
+    """
+    lines = [
+        json.dumps(
+            {
+                "custom_id": f"req-{idx}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": model, "messages": messages},
+            }
+        )
+        for idx, messages in enumerate(message_batches)
+    ]
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+    batch_file = client.files.create(file=("batch.jsonl", payload), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    deadline = time.time() + timeout
+    while batch.status not in {"completed", "failed", "expired", "cancelled"}:
+        if time.time() > deadline:
+            raise RuntimeError(f"OpenAI batch {batch.id} timed out in status {batch.status}")
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"OpenAI batch {batch.id} did not complete: {batch.status}")
+    content = client.files.content(batch.output_file_id).text
+    parsed_by_id: dict[str, Any] = {}
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        body = (record.get("response") or {}).get("body") or {}
+        choices = body.get("choices") or []
+        text = (choices[0].get("message") or {}).get("content") if choices else ""
+        parsed_by_id[record.get("custom_id", "")] = _parse_json_like(text or "")
+    return [parsed_by_id.get(f"req-{idx}") for idx in range(len(message_batches))]
+
+
 def generate_image(
     client: OpenAI,
     prompt: str,
@@ -118,8 +226,6 @@ def generate_image(
         background=background,
     )
     image_data = response.data[0].b64_json
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "wb") as f:
-        f.write(base64.b64decode(image_data))
+    write_b64_image(image_data, output_path)
     revised_prompt = getattr(response.data[0], "revised_prompt", None)
     return ImageResult(path=output_path, revised_prompt=revised_prompt)
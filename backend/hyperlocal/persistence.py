@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional
 
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from hyperlocal.models import CreativeAsset, CreativeRun, CreativeVariant
@@ -18,6 +20,40 @@ class PersistedVariant:
 class PersistenceManager:
     def __init__(self, session_factory) -> None:
         self._session_factory = session_factory
+        self._batch_session: Session | None = None
+
+    @contextmanager
+    def _session_scope(self) -> Iterator[Session]:
+        """Yield a session; commits per call unless a batch() is active."""
+        if self._batch_session is not None:
+            yield self._batch_session
+            self._batch_session.flush()
+            return
+        with self._session_factory() as session:
+            yield session
+            session.commit()
+
+    @contextmanager
+    def batch(self) -> Iterator["PersistenceManager"]:
+        """Group every call in the block into one session and transaction.
+
+        Writes flush as they happen and commit together when the block
+        exits (or roll back together on error), replacing one connection
+        checkout and fsync per call. Meant for bursts of adjacent writes:
+        it is not thread-safe, and slow work should stay outside the block
+        so the transaction stays short.
+        """
+        session = self._session_factory()
+        self._batch_session = session
+        try:
+            yield self
+            session.commit()
+        except BaseException:
+            session.rollback()
+            raise
+        finally:
+            self._batch_session = None
+            session.close()
 
     def create_run(
         self,
@@ -25,7 +61,7 @@ class PersistenceManager:
         model_versions: dict,
         status: str = "RUNNING",
     ) -> CreativeRun:
-        with self._session_factory() as session:
+        with self._session_scope() as session:
             run = CreativeRun(
                 campaign_id=brief.campaign_id,
                 status=status,
@@ -33,26 +69,23 @@ class PersistenceManager:
                 model_versions_json=model_versions,
             )
             session.add(run)
-            session.commit()
-            session.refresh(run)
+            session.flush()
             return run
 
     def update_run_style(self, run_id: int, style: BrandStyle) -> None:
-        with self._session_factory() as session:
+        with self._session_scope() as session:
             run = session.get(CreativeRun, run_id)
             if not run:
                 return
             run.brand_style_json = style.model_dump()
-            session.commit()
 
     def update_run_status(self, run_id: int, status: str, error: str | None = None) -> None:
-        with self._session_factory() as session:
+        with self._session_scope() as session:
             run = session.get(CreativeRun, run_id)
             if not run:
                 return
             run.status = status
             run.error = error
-            session.commit()
 
     def create_variant(
         self,
@@ -62,7 +95,7 @@ class PersistenceManager:
         prompt_text: str,
         negative_prompt: str,
     ) -> PersistedVariant:
-        with self._session_factory() as session:
+        with self._session_scope() as session:
             variant = CreativeVariant(
                 run_id=run_id,
                 variant_index=variant_index,
@@ -71,17 +104,51 @@ class PersistenceManager:
                 negative_prompt=negative_prompt,
             )
             session.add(variant)
-            session.commit()
-            session.refresh(variant)
+            session.flush()
             return PersistedVariant(id=variant.id, index=variant_index)
 
+    def create_variants(
+        self,
+        run_id: int,
+        variants: list[dict],
+    ) -> list[PersistedVariant]:
+        """Insert all variants for a run in one session and commit.
+
+        Each dict carries the same fields create_variant takes:
+        variant_index, copy (CopyVariant), prompt_text, negative_prompt.
+        A Core insert with RETURNING batches the rows (insertmanyvalues)
+        and hands back the generated ids in one statement, without
+        building ORM objects or touching the identity map.
+        """
+        with self._session_scope() as session:
+            stmt = insert(CreativeVariant).returning(
+                CreativeVariant.id,
+                CreativeVariant.variant_index,
+                sort_by_parameter_order=True,
+            )
+            rows = session.execute(
+                stmt,
+                [
+                    {
+                        "run_id": run_id,
+                        "variant_index": item["variant_index"],
+                        "copy_json": item["copy"].model_dump(),
+                        "prompt_text": item["prompt_text"],
+                        "negative_prompt": item["negative_prompt"],
+                    }
+                    for item in variants
+                ],
+            )
+            return [
+                PersistedVariant(id=row.id, index=row.variant_index) for row in rows
+            ]
+
     def update_variant_image(self, variant_id: int, image_url: str) -> None:
-        with self._session_factory() as session:
+        with self._session_scope() as session:
             variant = session.get(CreativeVariant, variant_id)
             if not variant:
                 return
             variant.image_url = image_url
-            session.commit()
 
     def update_variant_qc(
         self,
@@ -90,14 +157,78 @@ class PersistenceManager:
         qc_text: str | None = None,
         qc_score: float | None = None,
     ) -> None:
-        with self._session_factory() as session:
+        with self._session_scope() as session:
             variant = session.get(CreativeVariant, variant_id)
             if not variant:
                 return
             variant.qc_passed = qc_passed
             variant.qc_text = qc_text
             variant.qc_score = qc_score
-            session.commit()
+
+    def update_variant_result(
+        self,
+        variant_id: int,
+        *,
+        image_url: str,
+        qc_passed: bool,
+        qc_text: str | None = None,
+        qc_score: float | None = None,
+    ) -> None:
+        """Record the image URL and QC outcome together in one transaction.
+
+        The pipeline learns both at the same point, so a combined write
+        halves the per-variant session/commit cycles.
+        """
+        with self._session_scope() as session:
+            variant = session.get(CreativeVariant, variant_id)
+            if not variant:
+                return
+            variant.image_url = image_url
+            variant.qc_passed = qc_passed
+            variant.qc_text = qc_text
+            variant.qc_score = qc_score
+
+    def update_variant_results(self, rows: list[dict]) -> None:
+        """Apply image/QC outcomes for many variants in one UPDATE batch.
+
+        Each dict carries the variant row "id" plus the fields
+        update_variant_result sets; SQLAlchemy executes the list as an
+        executemany keyed on the primary key, replacing one session and
+        commit per variant with a single round trip.
+        """
+        if not rows:
+            return
+        with self._session_scope() as session:
+            session.execute(update(CreativeVariant), rows)
+
+    def create_assets(self, assets: list[dict]) -> list[int]:
+        """Insert many asset rows in one statement and return their ids.
+
+        Each dict carries the fields create_asset_from_variant takes
+        (campaign_id, run_id, variant_id, image_url, copy_text). Same
+        Core-insert fast path as create_variants: one executemany, ids
+        via RETURNING, no per-row unit-of-work bookkeeping.
+        """
+        if not assets:
+            return []
+        with self._session_scope() as session:
+            stmt = insert(CreativeAsset).returning(
+                CreativeAsset.id, sort_by_parameter_order=True
+            )
+            rows = session.execute(
+                stmt,
+                [
+                    {
+                        "campaign_id": item["campaign_id"],
+                        "run_id": item.get("run_id"),
+                        "variant_id": item.get("variant_id"),
+                        "image_path": item["image_url"],
+                        "copy_text": item.get("copy_text"),
+                    }
+                    for item in assets
+                ],
+            )
+            return [row.id for row in rows]
 
     def create_asset_from_variant(
         self,
@@ -107,7 +238,7 @@ class PersistenceManager:
         image_url: str,
         copy_text: Optional[str],
     ) -> CreativeAsset:
-        with self._session_factory() as session:
+        with self._session_scope() as session:
             asset = CreativeAsset(
                 campaign_id=campaign_id,
                 run_id=run_id,
@@ -116,6 +247,5 @@ class PersistenceManager:
                 copy_text=copy_text,
             )
             session.add(asset)
-            session.commit()
-            session.refresh(asset)
+            session.flush()
             return asset
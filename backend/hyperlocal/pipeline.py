@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from hyperlocal.config import RUNTIME_CONFIG
@@ -60,6 +61,7 @@ class FlyerPipeline:
         self.ollama_image_config = build_ollama_image_config(
             model=RUNTIME_CONFIG.ollama_image_model,
             timeout=RUNTIME_CONFIG.ollama_image_timeout,
+            cache_dir=RUNTIME_CONFIG.ollama_image_cache_dir,
         )
         self.comfyui_config = build_comfyui_config(
             api_url=RUNTIME_CONFIG.comfyui_api_url,
@@ -305,7 +307,9 @@ class FlyerPipeline:
             neg = negative_prompt_full()
         for variant in variants:
             packages.append(
-                PromptPackage(
+                # model_construct skips re-validation; every field here is
+                # data this code just built or already validated.
+                PromptPackage.model_construct(
                     image_prompt=prompt_fn(brief, style, variant),
                     negative_prompt=neg,
                     copy_variant=variant,
@@ -322,19 +326,25 @@ class FlyerPipeline:
         brief: CreativeBrief,
         style: BrandStyle,
     ) -> list[ImageVariant]:
-        variants: list[ImageVariant] = []
-        for idx, pkg in enumerate(packages, start=1):
+        # All variant rows go in up front as one multi-row INSERT instead of
+        # one commit per variant inside the generation loop.
+        variant_ids: list[int | None] = [None] * len(packages)
+        if self.persistence and run_id is not None:
+            records = self.persistence.create_variants(
+                run_id,
+                [
+                    {
+                        "variant_index": idx,
+                        "copy": pkg.copy_variant,
+                        "prompt_text": pkg.image_prompt,
+                        "negative_prompt": pkg.negative_prompt,
+                    }
+                    for idx, pkg in enumerate(packages, start=1)
+                ],
+            )
+            variant_ids = [record.id for record in records]
+        def generate_one(idx: int, pkg: PromptPackage) -> ImageVariant:
             image_path = str(Path(run_dir) / f"variant_{idx:02d}.png")
-            variant_id = None
-            if self.persistence and run_id is not None:
-                record = self.persistence.create_variant(
-                    run_id=run_id,
-                    variant_index=idx,
-                    copy=pkg.copy_variant,
-                    prompt_text=pkg.image_prompt,
-                    negative_prompt=pkg.negative_prompt,
-                )
-                variant_id = record.id
             qc_passed = False
             qc_text = ""
             for attempt in range(1, RUNTIME_CONFIG.max_image_attempts + 1):
@@ -397,26 +407,59 @@ class FlyerPipeline:
                 if qc_passed:
                     break
                 time.sleep(1)
-            image_url = image_path
-            if self.storage and run_id is not None:
-                key = key_for_image(run_id, idx)
-                image_url = self.storage.upload_file(image_path, key)
-            if self.persistence and variant_id is not None:
-                self.persistence.update_variant_image(variant_id, image_url)
-                self.persistence.update_variant_qc(variant_id, qc_passed, qc_text)
-            variants.append(
-                ImageVariant(
-                    index=idx,
-                    prompt=pkg,
-                    image_path=image_url,
-                    qc_passed=qc_passed,
-                    qc_text=qc_text,
-                )
+            return ImageVariant.model_construct(
+                index=idx,
+                prompt=pkg,
+                image_path=image_path,
+                qc_passed=qc_passed,
+                qc_text=qc_text,
+            )
+
+        # All variants share one provider config, so they can be submitted
+        # concurrently when HYPERLOCAL_IMAGE_WORKERS > 1; the default stays
+        # sequential for single-GPU backends. pool.map keeps variant order.
+        workers = max(1, RUNTIME_CONFIG.image_workers)
+        if workers == 1:
+            variants = [generate_one(idx, pkg) for idx, pkg in enumerate(packages, start=1)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(workers, len(packages))) as pool:
+                variants = list(pool.map(generate_one, range(1, len(packages) + 1), packages))
+
+        if self.storage and run_id is not None and variants:
+            # Uploads are latency-bound and independent of each other, so
+            # they run in a pool after generation instead of serialising
+            # one upload per variant inside the generation loop.
+            def upload_one(variant: ImageVariant) -> str:
+                key = key_for_image(run_id, variant.index)
+                return self.storage.upload_file(variant.image_path, key)
+
+            with ThreadPoolExecutor(max_workers=min(8, len(variants))) as pool:
+                for variant, url in zip(variants, pool.map(upload_one, variants)):
+                    variant.image_path = url
+
+        if self.persistence:
+            self.persistence.update_variant_results(
+                [
+                    {
+                        "id": variant_id,
+                        "image_url": variant.image_path,
+                        "qc_passed": variant.qc_passed,
+                        "qc_text": variant.qc_text,
+                    }
+                    for variant_id, variant in zip(variant_ids, variants)
+                    if variant_id is not None
+                ]
             )
         return variants
 
-    def run(self, brief: CreativeBrief) -> RunResult:
-        self._active_brief = brief
+    def _start_run(
+        self, brief: CreativeBrief
+    ) -> tuple[CreativeBrief, object, BrandStyle, list[PromptPackage]]:
+        """Copy/style stage of a run: everything up to image generation.
+
+        Only uses the LLM clients, so it is safe to run on a helper thread
+        while another brief is busy with the image backend.
+        """
         run_record = None
         model_versions = {
             "text_model": self.text_model,
@@ -431,6 +474,22 @@ class FlyerPipeline:
                 self.persistence.update_run_style(run_record.id, style)
             variants = self.generate_copy_variants(brief, style)
             packages = self.build_prompt_packages(brief, style, variants)
+            return brief, run_record, style, packages
+        except Exception as exc:
+            if self.persistence and run_record:
+                self.persistence.update_run_status(run_record.id, "FAILED", str(exc))
+            raise
+
+    def _finish_run(
+        self,
+        brief: CreativeBrief,
+        run_record: object,
+        style: BrandStyle,
+        packages: list[PromptPackage],
+    ) -> RunResult:
+        """Image/QC stage of a run; consumes the output of _start_run."""
+        self._active_brief = brief
+        try:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             run_dir = str(Path(RUNTIME_CONFIG.output_dir) / f"flyer_runs/{timestamp}")
             Path(run_dir).mkdir(parents=True, exist_ok=True)
@@ -442,7 +501,7 @@ class FlyerPipeline:
                 style=style,
             )
 
-            result = RunResult(
+            result = RunResult.model_construct(
                 brief=brief,
                 brand_style=style,
                 variants=images,
@@ -460,6 +519,29 @@ class FlyerPipeline:
         finally:
             self._active_brief = None
 
+    def run(self, brief: CreativeBrief) -> RunResult:
+        brief, run_record, style, packages = self._start_run(brief)
+        return self._finish_run(brief, run_record, style, packages)
+
+    def run_batch(self, briefs: list[CreativeBrief]) -> list[RunResult]:
+        """Run several briefs back to back on one pipeline instance.
+
+        The copy/style stage for brief N+1 runs on a helper thread while
+        brief N generates images, so the text models and the image backend
+        stay busy at the same time instead of taking turns. Failures
+        propagate just like run(); already-completed results are lost to the
+        caller but their run directories and DB records remain.
+        """
+        results: list[RunResult] = []
+        with ThreadPoolExecutor(max_workers=1) as prep:
+            pending = prep.submit(self._start_run, briefs[0]) if briefs else None
+            for idx in range(len(briefs)):
+                staged = pending.result()
+                if idx + 1 < len(briefs):
+                    pending = prep.submit(self._start_run, briefs[idx + 1])
+                results.append(self._finish_run(*staged))
+        return results
+
     def _required_details(self, brief: CreativeBrief | None) -> list[str]:
         if not brief:
             return []
@@ -23,10 +23,80 @@ def _format_hours(details: BusinessDetails | None) -> str:
     return "; ".join(parts)
 
 
+# Constant template skeletons are assembled once at import; per-call work is
+# reduced to the variable substitutions.
+_COPY_PROMPT_TEMPLATE = (
+    "You are a direct-response copywriter for a mailer flyer. "
+    "Return exactly {variants} copy variants as JSON array. "
+    "Each variant must include: headline, subhead, body, cta, disclaimer. "
+    "Constraints: headline <= 6 words, subhead <= 10 words, body <= 28 words, "
+    "cta <= 4 words, disclaimer <= 12 words. "
+    "Keep text clean and printable. Avoid emojis. English only. "
+    "Include the business name in the copy. "
+    "Preferred CTA: {cta}. Use it as the CTA if possible. "
+    "Required details: {constraints}. "
+    "{details_text}"
+    "Business: {business_name}. "
+    "Product: {product}. Offer: {offer}. Tone: {tone}. "
+    "Audience: {audience}. "
+    "Palette: {palette}. "
+    "Style: {style_keywords}. "
+    "Return JSON only, no markdown."
+)
+
+_BACKGROUND_PROMPT_TEMPLATE = (
+    "Create a background-only image for a 6x9 inch direct-mail flyer. "
+    "Do NOT include any text, letters, words, logos, signage, or typography. "
+    "Leave ample clean space for a text overlay. "
+    "Visual style: {style_keywords}. "
+    "Color palette: {palette}. "
+    "Layout guidance: {layout_guidance}. "
+    "Business: {business_name}. Product: {product}. Offer: {offer}. "
+    "Constraints: {constraints}. "
+    "Use high-quality lighting and depth. Make the background visually rich but not busy."
+)
+
+_FLYER_PROMPT_TEMPLATE = (
+    "Create a full 6x9 inch direct-mail flyer image. "
+    "All text must be legible and match the copy exactly (no paraphrasing). "
+    "Use clean, high-contrast typography and generous spacing. "
+    "Visual style: {style_keywords}. "
+    "Color palette: {palette}. "
+    "Layout guidance: {layout_guidance}. "
+    "Business: {business_name}. Product: {product}. Offer: {offer}. "
+    "Constraints: {constraints}. "
+    "Include this exact copy in the layout: "
+    "Headline: {headline}. "
+    "Subhead: {subhead}. "
+    "Body: {body}. "
+    "CTA: {cta}. "
+    "Disclaimer: {disclaimer}. "
+    "Business details: {block}. "
+    "Audience line: {audience}."
+)
+
+# One-slot identity cache: a pipeline run calls the prompt builders once per
+# variant with the same brief/style pair, so the joined fragments are computed
+# once instead of per variant. Strong refs keep the identity check sound.
+_fragments_cache: tuple[CreativeBrief, BrandStyle, tuple[str, str, str]] | None = None
+
+
+def _shared_fragments(brief: CreativeBrief, style: BrandStyle) -> tuple[str, str, str]:
+    global _fragments_cache
+    cached = _fragments_cache
+    if cached is not None and cached[0] is brief and cached[1] is style:
+        return cached[2]
+    fragments = (
+        ", ".join(style.palette or brief.brand_colors or []),
+        ", ".join(style.style_keywords or brief.style_keywords or []),
+        "; ".join(brief.constraints or []),
+    )
+    _fragments_cache = (brief, style, fragments)
+    return fragments
+
+
 def copy_prompt(brief: CreativeBrief, style: BrandStyle, variants: int) -> str:
-    palette = ", ".join(style.palette or brief.brand_colors or [])
-    style_keywords = ", ".join(style.style_keywords or brief.style_keywords or [])
-    constraints = "; ".join(brief.constraints or [])
+    palette, style_keywords, constraints = _shared_fragments(brief, style)
     details = brief.business_details
     details_text = ""
     business_name = ""
@@ -39,27 +109,37 @@ def copy_prompt(brief: CreativeBrief, style: BrandStyle, variants: int) -> str:
             f"Phone {details.phone or ''}. Hours {hours_text or ''}. "
             f"Service area {details.service_area or ''}. Website {details.website or ''}. "
         )
-    return (
-        "You are a direct-response copywriter for a mailer flyer. "
-        f"Return exactly {variants} copy variants as JSON array. "
-        "Each variant must include: headline, subhead, body, cta, disclaimer. "
-        "Constraints: headline <= 6 words, subhead <= 10 words, body <= 28 words, "
-        "cta <= 4 words, disclaimer <= 12 words. "
-        "Keep text clean and printable. Avoid emojis. English only. "
-        "Include the business name in the copy. "
-        f"Preferred CTA: {brief.cta}. Use it as the CTA if possible. "
-        f"Required details: {constraints or 'none'}. "
-        f"{details_text}"
-        f"Business: {business_name or 'not specified'}. "
-        f"Product: {brief.product}. Offer: {brief.offer}. Tone: {brief.tone}. "
-        f"Audience: {brief.audience or 'local households'}. "
-        f"Palette: {palette or 'not specified'}. "
-        f"Style: {style_keywords or 'modern, friendly'}. "
-        "Return JSON only, no markdown."
+    return _COPY_PROMPT_TEMPLATE.format(
+        variants=variants,
+        cta=brief.cta,
+        constraints=constraints or "none",
+        details_text=details_text,
+        business_name=business_name or "not specified",
+        product=brief.product,
+        offer=brief.offer,
+        tone=brief.tone,
+        audience=brief.audience or "local households",
+        palette=palette or "not specified",
+        style_keywords=style_keywords or "modern, friendly",
     )
 
 
+# Same one-slot shape as _fragments_cache: the block is rebuilt per variant
+# from the same brief, and walking the details fields dominates the call.
+_block_cache: tuple[CreativeBrief, str] | None = None
+
+
 def business_block(brief: CreativeBrief) -> str:
+    global _block_cache
+    cached = _block_cache
+    if cached is not None and cached[0] is brief:
+        return cached[1]
+    block = _build_business_block(brief)
+    _block_cache = (brief, block)
+    return block
+
+
+def _build_business_block(brief: CreativeBrief) -> str:
     details = brief.business_details
     if not details:
         return ""
@@ -80,63 +160,56 @@ def business_block(brief: CreativeBrief) -> str:
 
 
 def background_prompt(brief: CreativeBrief, style: BrandStyle, copy: CopyVariant) -> str:
-    palette = ", ".join(style.palette or brief.brand_colors or [])
-    style_keywords = ", ".join(style.style_keywords or brief.style_keywords or [])
+    palette, style_keywords, constraints = _shared_fragments(brief, style)
     layout_guidance = style.layout_guidance or (
         "Large clean focal area with soft gradients, a clear visual anchor, and ample negative space."
     )
-    constraints = "; ".join(brief.constraints or [])
     details = brief.business_details
     business_name = details.name if details else ""
-    return (
-        "Create a background-only image for a 6x9 inch direct-mail flyer. "
-        "Do NOT include any text, letters, words, logos, signage, or typography. "
-        "Leave ample clean space for a text overlay. "
-        f"Visual style: {style_keywords or 'bright, fresh, modern'}. "
-        f"Color palette: {palette or 'vibrant fruit colors, fresh greens, clean whites'}. "
-        f"Layout guidance: {layout_guidance}. "
-        f"Business: {business_name or 'not specified'}. Product: {brief.product}. Offer: {brief.offer}. "
-        f"Constraints: {constraints or 'No people; no faces; no extra slogans'}. "
-        "Use high-quality lighting and depth. Make the background visually rich but not busy."
+    return _BACKGROUND_PROMPT_TEMPLATE.format(
+        style_keywords=style_keywords or "bright, fresh, modern",
+        palette=palette or "vibrant fruit colors, fresh greens, clean whites",
+        layout_guidance=layout_guidance,
+        business_name=business_name or "not specified",
+        product=brief.product,
+        offer=brief.offer,
+        constraints=constraints or "No people; no faces; no extra slogans",
     )
 
 
+_COMFYUI_LAYOUT_SUFFIX = (
+    " Include layout-friendly design elements: a soft top banner area, "
+    "a button-like CTA bar near the bottom, and subtle rounded panels or "
+    "color blocks to frame the copy. Keep all text areas empty."
+)
+
+
 def comfyui_background_prompt(brief: CreativeBrief, style: BrandStyle, copy: CopyVariant) -> str:
-    base = background_prompt(brief, style, copy)
-    return (
-        base
-        + " Include layout-friendly design elements: a soft top banner area, "
-        + "a button-like CTA bar near the bottom, and subtle rounded panels or "
-        + "color blocks to frame the copy. Keep all text areas empty."
-    )
+    return background_prompt(brief, style, copy) + _COMFYUI_LAYOUT_SUFFIX
 
 
 def flyer_prompt(brief: CreativeBrief, style: BrandStyle, copy: CopyVariant) -> str:
-    palette = ", ".join(style.palette or brief.brand_colors or [])
-    style_keywords = ", ".join(style.style_keywords or brief.style_keywords or [])
+    palette, style_keywords, constraints = _shared_fragments(brief, style)
     layout_guidance = style.layout_guidance or (
         "Clear visual hierarchy with headline, subhead, body, a CTA button, and footer details."
     )
-    constraints = "; ".join(brief.constraints or [])
     business_name = brief.business_details.name if brief.business_details else ""
     block = business_block(brief)
-    return (
-        "Create a full 6x9 inch direct-mail flyer image. "
-        "All text must be legible and match the copy exactly (no paraphrasing). "
-        "Use clean, high-contrast typography and generous spacing. "
-        f"Visual style: {style_keywords or 'bright, fresh, modern'}. "
-        f"Color palette: {palette or 'vibrant fruit colors, fresh greens, clean whites'}. "
-        f"Layout guidance: {layout_guidance}. "
-        f"Business: {business_name or 'not specified'}. Product: {brief.product}. Offer: {brief.offer}. "
-        f"Constraints: {constraints or 'No people; no faces; no extra slogans'}. "
-        "Include this exact copy in the layout: "
-        f"Headline: {copy.headline}. "
-        f"Subhead: {copy.subhead}. "
-        f"Body: {copy.body}. "
-        f"CTA: {copy.cta}. "
-        f"Disclaimer: {copy.disclaimer or ''}. "
-        f"Business details: {block}. "
-        f"Audience line: {brief.audience or ''}."
+    return _FLYER_PROMPT_TEMPLATE.format(
+        style_keywords=style_keywords or "bright, fresh, modern",
+        palette=palette or "vibrant fruit colors, fresh greens, clean whites",
+        layout_guidance=layout_guidance,
+        business_name=business_name or "not specified",
+        product=brief.product,
+        offer=brief.offer,
+        constraints=constraints or "No people; no faces; no extra slogans",
+        headline=copy.headline,
+        subhead=copy.subhead,
+        body=copy.body,
+        cta=copy.cta,
+        disclaimer=copy.disclaimer or "",
+        block=block,
+        audience=brief.audience or "",
     )
 
 
@@ -144,16 +217,21 @@ def image_prompt(brief: CreativeBrief, style: BrandStyle, copy: CopyVariant) ->
     return background_prompt(brief, style, copy)
 
 
+NEGATIVE_PROMPT = (
+    "Avoid any text, letters, words, or signage. Avoid illegible or distorted text, "
+    "cluttered layouts, and low contrast. Avoid extra text not provided. "
+    "Avoid faces, hands, or people."
+)
+
+NEGATIVE_PROMPT_FULL = (
+    "Avoid illegible or distorted text, cluttered layouts, and low contrast. "
+    "Avoid extra text not provided. Avoid faces, hands, or people."
+)
+
+
 def negative_prompt() -> str:
-    return (
-        "Avoid any text, letters, words, or signage. Avoid illegible or distorted text, "
-        "cluttered layouts, and low contrast. Avoid extra text not provided. "
-        "Avoid faces, hands, or people."
-    )
+    return NEGATIVE_PROMPT
 
 
 def negative_prompt_full() -> str:
-    return (
-        "Avoid illegible or distorted text, cluttered layouts, and low contrast. "
-        "Avoid extra text not provided. Avoid faces, hands, or people."
-    )
+    return NEGATIVE_PROMPT_FULL
@@ -1,7 +1,26 @@
 from __future__ import annotations
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+class _CachedDumpModel(BaseModel):
+    """Base for models that do not change once built.
+
+    model_dump() walks the full model tree, and persistence repeats it for
+    the same object within a run (brief, style, per-variant copy). The plain
+    dump is computed once and reused; callers must treat the returned dict
+    as read-only. Customised dumps (any kwargs) bypass the cache.
+    """
+
+    _cached_dump: Optional[dict] = PrivateAttr(default=None)
+
+    def model_dump(self, **kwargs) -> dict:
+        if kwargs:
+            return super().model_dump(**kwargs)
+        if self._cached_dump is None:
+            self._cached_dump = super().model_dump()
+        return self._cached_dump
 
 
 class BusinessDayHours(BaseModel):
@@ -30,7 +49,7 @@ class BusinessDetails(BaseModel):
     service_area: Optional[str] = None
 
 
-class CreativeBrief(BaseModel):
+class CreativeBrief(_CachedDumpModel):
     campaign_id: Optional[int] = None
     business_details: BusinessDetails
     product: str
@@ -45,14 +64,14 @@ class CreativeBrief(BaseModel):
     reference_images: List[str] = Field(default_factory=list, description="Local file paths")
 
 
-class BrandStyle(BaseModel):
+class BrandStyle(_CachedDumpModel):
     palette: List[str] = Field(default_factory=list)
     style_keywords: List[str] = Field(default_factory=list)
     layout_guidance: str = ""
     typography_guidance: str = ""
 
 
-class CopyVariant(BaseModel):
+class CopyVariant(_CachedDumpModel):
     headline: str
     subhead: str
     body: str
@@ -2,9 +2,26 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-import boto3
+# boto3 is imported lazily: loading its service models costs a few hundred
+# milliseconds, which every entrypoint would pay even with storage disabled.
+
+
+@lru_cache(maxsize=1)
+def _transfer_config():
+    from boto3.s3.transfer import TransferConfig
+
+    # Shared across uploads: multipart for large images, with parallel parts.
+    # The fixed chunk size bounds peak memory to chunksize x concurrency
+    # instead of scaling with file size.
+    return TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=8 * 1024 * 1024,
+        max_concurrency=8,
+        use_threads=True,
+    )
 
 
 @dataclass
@@ -22,28 +39,54 @@ class StorageClient:
     def __init__(self, config: StorageConfig) -> None:
         if not config.bucket:
             raise RuntimeError("S3_BUCKET is not set")
+        import boto3
+        from botocore.config import Config
+
         self.config = config
+        # URL prefixes are fixed per client; build them once instead of
+        # per upload.
+        self._url_prefix = (
+            config.public_base_url.rstrip("/") + "/" if config.public_base_url else None
+        )
+        self._s3_prefix = f"s3://{config.bucket}/"
         self.client = boto3.client(
             "s3",
             endpoint_url=config.endpoint_url,
             aws_access_key_id=config.access_key,
             aws_secret_access_key=config.secret_key,
             region_name=config.region,
+            # Keep connections warm across variant uploads so concurrent
+            # uploads amortise the TLS handshakes.
+            config=Config(
+                max_pool_connections=32,
+                tcp_keepalive=True,
+                retries={"mode": "adaptive"},
+            ),
         )
 
     def upload_file(self, path: str, key: str, content_type: str = "image/png") -> str:
-        self.client.upload_file(
-            path,
-            self.config.bucket,
-            key,
-            ExtraArgs={"ContentType": content_type},
-        )
-        if self.config.public_base_url:
-            return f"{self.config.public_base_url.rstrip('/')}/{key}"
-        return f"s3://{self.config.bucket}/{key}"
+        # Stream straight from disk; print-resolution PNGs run tens of MB
+        # and never need to sit in memory whole.
+        with open(path, "rb", buffering=1024 * 1024) as f:
+            self.client.upload_fileobj(
+                f,
+                self.config.bucket,
+                key,
+                ExtraArgs={"ContentType": content_type},
+                Config=_transfer_config(),
+            )
+        if self._url_prefix:
+            return self._url_prefix + key
+        return self._s3_prefix + key
 
 
+@lru_cache(maxsize=1)
 def build_storage() -> StorageClient | None:
+    """Build the process-wide storage client (or None when disabled).
+
+    Cached so repeated runs share one boto3 client and its connection pool
+    instead of rebuilding both per call.
+    """
     config = StorageConfig()
     if not config.enabled:
         return None
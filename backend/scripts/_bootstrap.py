@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+"""
+Shared sys.path bootstrap for the CLI scripts.
+
+Each script previously resolved the backend root and mutated sys.path itself;
+importing this module does the resolve()/insert exactly once per interpreter,
+so scripts that import each other stop repeating the path setup.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
@@ -3,12 +3,8 @@ from __future__ import annotations
 import json
 
 from dotenv import load_dotenv
-from pathlib import Path
-import sys
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from _bootstrap import ROOT  # noqa: F401  (adds the backend root to sys.path)
 
 from hyperlocal.health import run_health_checks
 
@@ -21,18 +21,17 @@ Notes:
 """
 
 import argparse
-import json
 import shlex
-from dataclasses import asdict
-from datetime import datetime
+import time
+from functools import lru_cache
+from dataclasses import fields
 from pathlib import Path
 import sys
 
+import orjson
 from dotenv import load_dotenv
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from _bootstrap import ROOT  # noqa: F401  (adds the backend root to sys.path)
 
 from hyperlocal.config import MODEL_CONFIG, RUNTIME_CONFIG
 from hyperlocal.image_providers import (
@@ -40,6 +39,7 @@ from hyperlocal.image_providers import (
     build_sdxl_config,
     generate_ollama_image,
     generate_sdxl_image,
+    route_ollama_model,
 )
 from hyperlocal.openai_helpers import build_client, generate_image
 
@@ -47,13 +47,14 @@ from scripts.generate_ad_prompts import build_llm_prompts, build_template_prompt
 
 
 def timestamp() -> str:
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return time.strftime("%Y%m%d_%H%M%S")
 
 
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=None)
 def _normalize_provider(value: str) -> str:
     value = (value or "").strip().lower().replace("-", "_")
     if value in {"sdxl"}:
@@ -65,11 +66,17 @@ def _normalize_provider(value: str) -> str:
     raise ValueError("image provider must be one of: ollama, sdxl, openai")
 
 
+def write_json(path: Path, obj: object) -> None:
+    path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n")
+
+
 def write_flat_files(run_dir: Path, *, specs: list[object], meta: dict) -> None:
     ensure_dir(run_dir)
-    (run_dir / "manifest.json").write_text(json.dumps(meta, indent=2) + "\n")
-    (run_dir / "prompts.json").write_text(
-        json.dumps([asdict(s) for s in specs], indent=2) + "\n"
+    write_json(run_dir / "manifest.json", meta)
+    # Flat dataclass of plain strings: field iteration avoids asdict's recursive deepcopy.
+    write_json(
+        run_dir / "prompts.json",
+        [{f.name: getattr(s, f.name) for f in fields(s)} for s in specs],
     )
     for i, spec in enumerate(specs, start=1):
         prefix = f"{i:02d}__{spec.slug}"
@@ -117,6 +124,11 @@ def main() -> None:
         default="ad_creatives",
         help="Output folder under output/ (default: ad_creatives).",
     )
+    parser.add_argument(
+        "--auto-route-model",
+        action="store_true",
+        help="Route simple prompts to the lighter turbo model (ollama provider only).",
+    )
     args = parser.parse_args()
 
     count = max(1, args.count)
@@ -157,7 +169,7 @@ def main() -> None:
     run_dir = Path(RUNTIME_CONFIG.output_dir) / args.out_subdir / timestamp()
 
     meta = {
-        "created_at": datetime.now().isoformat(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
         "engine": args.engine,
         "count": meta_count,
         "business_kind": args.business_kind,
@@ -181,14 +193,24 @@ def main() -> None:
         config = build_ollama_image_config(
             model=model,
             timeout=RUNTIME_CONFIG.ollama_image_timeout,
+            cache_dir=RUNTIME_CONFIG.ollama_image_cache_dir,
         )
         meta["image_model"] = model
-        (run_dir / "manifest.json").write_text(json.dumps(meta, indent=2) + "\n")
+        write_json(run_dir / "manifest.json", meta)
 
         for i, spec in enumerate(specs, start=1):
+            spec_config = config
+            if args.auto_route_model:
+                routed = route_ollama_model(spec.prompt, default_model=model)
+                if routed != model:
+                    spec_config = build_ollama_image_config(
+                        model=routed,
+                        timeout=RUNTIME_CONFIG.ollama_image_timeout,
+                        cache_dir=RUNTIME_CONFIG.ollama_image_cache_dir,
+                    )
             image_path = run_dir / f"{i:02d}__{spec.slug}.png"
             print(f"Generating image {i}/{len(specs)} -> {image_path}", flush=True)
-            generate_ollama_image(prompt=spec.prompt, output_path=str(image_path), config=config)
+            generate_ollama_image(prompt=spec.prompt, output_path=str(image_path), config=spec_config)
 
     elif provider == "sdxl":
         config = build_sdxl_config(
@@ -217,7 +239,7 @@ def main() -> None:
         )
         model = args.image_model or RUNTIME_CONFIG.image_model
         meta["image_model"] = model
-        (run_dir / "manifest.json").write_text(json.dumps(meta, indent=2) + "\n")
+        write_json(run_dir / "manifest.json", meta)
         for i, spec in enumerate(specs, start=1):
             image_path = run_dir / f"{i:02d}__{spec.slug}.png"
             print(f"Generating image {i}/{len(specs)} -> {image_path}", flush=True)
@@ -18,26 +18,25 @@ Examples:
 """
 
 import argparse
+import hashlib
 import json
+import time
 import re
 import string
-from dataclasses import asdict, dataclass
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-import sys
 
+import orjson
 from dotenv import load_dotenv
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from _bootstrap import ROOT  # noqa: F401  (adds the backend root to sys.path)
 
 from hyperlocal.config import RUNTIME_CONFIG
-from hyperlocal.llm_providers import build_llm_clients
-from hyperlocal.openai_helpers import chat_json
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromptSpec:
     slug: str
     title: str
@@ -50,20 +49,200 @@ class PromptSpec:
     offer: str
     product: str
 
+    def as_dict(self) -> dict[str, str]:
+        # Direct construction: every field is a plain string, so asdict's
+        # recursive deepcopy machinery buys nothing here.
+        return {
+            "slug": self.slug,
+            "title": self.title,
+            "prompt": self.prompt,
+            "negative_prompt": self.negative_prompt,
+            "text_mode": self.text_mode,
+            "format_hint": self.format_hint,
+            "business_kind": self.business_kind,
+            "business_name": self.business_name,
+            "offer": self.offer,
+            "product": self.product,
+        }
+
 
 def timestamp() -> str:
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return time.strftime("%Y%m%d_%H%M%S")
 
 
 _SLUG_RE = re.compile(r"[^a-z0-9]+")
 
+# One compiled pass over the title instead of a per-character membership test
+# against string.printable.
+_NON_PRINTABLE_RE = re.compile("[^" + re.escape(string.printable) + "]")
+
+
+def _ascii_title(value: str) -> str:
+    # Keep filenames/UI clean; prompt content is what matters.
+    return " ".join(_NON_PRINTABLE_RE.sub("", value).split())
+
+
+# Compiled once: a single alternation scan beats a per-token substring loop
+# when validating dozens of candidate specs.
+_HVAC_BANNED_ANYWHERE_RE = re.compile(
+    "|".join(
+        re.escape(tok)
+        for tok in (
+            "sticker",
+            "watermark",
+            "graph",
+            "chart",
+            "diagram",
+            "infographic",
+            "thermostat",
+            "placeholder",
+            "badge",
+            "seal",
+            "corner logo",
+            "text placeholder",
+            "logo sticker",
+            "logo in corner",
+            "company logo",
+        )
+    )
+)
+_HVAC_BANNED_CONSTRAINTS_RE = re.compile(
+    "|".join(re.escape(tok) for tok in ("logo in corner", "logo sticker", "company logo"))
+)
+_HVAC_BANNED_POSITIVE_RE = re.compile(
+    "|".join(
+        re.escape(tok)
+        for tok in ("illustration", "icon", "ui", "infographic", "diagram", "graph", "chart")
+    )
+)
+_HVAC_SOFT_BANNED_TOKENS = (
+    "logo",
+    "icons",
+    "icon",
+    "illustration",
+    "diagram",
+    "graph",
+    "ui",
+    "thermostat",
+    "text",
+)
+
+# Max specs requested from the LLM in a single call; larger counts fan out
+# across concurrent requests in build_llm_prompts.
+_LLM_BATCH_SIZE = 6
+
+_SPEC_CACHE_DIR = Path(RUNTIME_CONFIG.output_dir) / "cache" / "prompt_specs"
+
+# Skeleton cache: validated LLM spec structures with the business-specific
+# strings templated out, so runs that only change name/offer/product reuse the
+# expensive structural generation instead of re-asking the model.
+_SKELETON_CACHE_DIR = Path(RUNTIME_CONFIG.output_dir) / "cache" / "spec_skeletons"
+_SKELETON_FIELDS = (
+    "slug",
+    "title",
+    "subject",
+    "scene",
+    "composition",
+    "lighting",
+    "style",
+    "constraints",
+)
+
+
+def _spec_cache_path(
+    *,
+    business_kind: str,
+    business_name: str,
+    offer: str,
+    product: str,
+    text_mode: str,
+    format_hint: str,
+    count: int,
+) -> Path:
+    key = json.dumps(
+        [business_kind, business_name, offer, product, text_mode, format_hint, count]
+    )
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return _SPEC_CACHE_DIR / f"{business_kind}_{digest}.json"
+
+
+def _skeleton_cache_path(*, business_kind: str, text_mode: str, format_hint: str) -> Path:
+    key = json.dumps([business_kind, text_mode, format_hint])
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return _SKELETON_CACHE_DIR / f"{business_kind}_{digest}.json"
+
+
+def _templatize_skeleton(
+    item: dict, *, business_name: str, offer: str, product: str
+) -> dict:
+    out: dict[str, str] = {}
+    for field in _SKELETON_FIELDS:
+        value = str(item.get(field, "") or "")
+        for token, placeholder in (
+            (business_name, "{{business_name}}"),
+            (offer, "{{offer}}"),
+            (product, "{{product}}"),
+        ):
+            if token:
+                value = value.replace(token, placeholder)
+        out[field] = value
+    return out
+
+
+def _instantiate_skeleton(
+    item: dict, *, business_name: str, offer: str, product: str
+) -> dict:
+    out: dict[str, str] = {}
+    for field in _SKELETON_FIELDS:
+        value = str(item.get(field, "") or "")
+        value = value.replace("{{business_name}}", business_name)
+        value = value.replace("{{offer}}", offer)
+        value = value.replace("{{product}}", product)
+        out[field] = value
+    return out
+
+
+def _load_cached_skeletons(path: Path, count: int) -> list[dict] | None:
+    try:
+        raw = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, list) or len(raw) < count:
+        return None
+    return raw[:count]
+
+
+def _store_cached_skeletons(path: Path, items: list[dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(items, indent=2) + "\n")
+
+
+def _load_cached_specs(path: Path, count: int) -> list[PromptSpec] | None:
+    try:
+        raw = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    try:
+        specs = [PromptSpec(**item) for item in raw]
+    except TypeError:
+        return None
+    if len(specs) < count:
+        return None
+    return specs[:count]
+
+
+def _store_cached_specs(path: Path, specs: list[PromptSpec]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps([s.as_dict() for s in specs], indent=2) + "\n")
+
 
 def slugify(value: str) -> str:
-    value = value.strip().lower()
-    value = _SLUG_RE.sub("_", value).strip("_")
-    return value or "prompt"
+    # _SLUG_RE already collapses leading/trailing junk into underscores that
+    # strip("_") removes, so a separate whitespace strip() pass is redundant.
+    return _SLUG_RE.sub("_", value.lower()).strip("_") or "prompt"
 
 
+@lru_cache(maxsize=None)
 def base_constraints(*, business_kind: str, text_mode: str, business_name: str, offer: str) -> str:
     parts = ["Portrait 6x9 composition.", "High-quality lighting, crisp detail, clean styling."]
     if business_kind == "smoothie":
@@ -104,6 +283,7 @@ def base_constraints(*, business_kind: str, text_mode: str, business_name: str,
     return " ".join(parts)
 
 
+@lru_cache(maxsize=None)
 def base_negative_prompt(*, business_kind: str, text_mode: str) -> str:
     extra = ""
     if business_kind == "hvac":
@@ -124,6 +304,73 @@ def base_negative_prompt(*, business_kind: str, text_mode: str) -> str:
     )
 
 
+_SCHEMA_EXAMPLE = (
+    "["
+    "{"
+    "\"slug\":\"mango_hero_pair\","
+    "\"title\":\"Mango Hero Pair\","
+    "\"subject\":\"Two clear mango smoothies with condensation\","
+    "\"scene\":\"Clean tropical prep surface with mango slices and mint\","
+    "\"composition\":\"Portrait 6x9, hero in lower-left, large negative space upper-right\","
+    "\"lighting\":\"Bright studio softbox, crisp highlights\","
+    "\"style\":\"Photorealistic commercial food photography, modern\","
+    "\"constraints\":\"No people. No branding. Overlay-safe negative space.\""
+    "}"
+    "]"
+)
+
+_HVAC_CONCEPTS = (
+    "HVAC concept options (pick from these; do not invent diagrams/graphs/UI): "
+    "1) Clean modern living room with a visible vent and subtle cool airflow. "
+    "2) Outdoor AC condenser beside a modern home exterior (no labels/plates). "
+    "3) Close-up of a clean HVAC register/vent with premium lighting. "
+    "4) Abstract cool-blue photographic gradient background with realistic shadows (no icons)."
+)
+
+# For HVAC we get better compliance by asking the model to refine safe seeds rather than inventing
+# infographic-like concepts (graphs, icons, thermostats, etc).
+_HVAC_SEEDS: tuple[dict[str, str], ...] = (
+    {
+        "slug": "interior_vent_airflow",
+        "title": "Interior Vent Airflow",
+        "subject": "Clean modern living room with a visible air vent",
+        "scene": "Minimal contemporary home interior, tidy surfaces, cool air feel",
+        "composition": "Portrait 6x9; vent/hero in lower third; large clean negative space in upper half for overlay copy",
+        "lighting": "Bright natural daylight with soft shadows, crisp highlights",
+        "style": "Photorealistic commercial advertising photography, premium and clean",
+        "constraints": "No people. No branding. No tools in use. Overlay-safe negative space.",
+    },
+    {
+        "slug": "outdoor_condenser",
+        "title": "Outdoor Condenser",
+        "subject": "Clean outdoor AC condenser unit",
+        "scene": "Modern home exterior in bright daylight, minimal landscaping, no labels or plates",
+        "composition": "Portrait 6x9; condenser framed low; generous negative space above for overlay copy",
+        "lighting": "Sunny daylight, soft controlled shadows, high clarity",
+        "style": "Photorealistic commercial service ad photography, modern and trustworthy",
+        "constraints": "No people. No vehicles. No branding. Overlay-safe negative space.",
+    },
+    {
+        "slug": "register_closeup",
+        "title": "Register Close-Up",
+        "subject": "Close-up of a clean HVAC register/vent",
+        "scene": "Minimal modern interior background, subtle cool haze (not icons) to imply airflow",
+        "composition": "Portrait 6x9; register in lower-left; clean empty space top-right for overlay copy",
+        "lighting": "Premium softbox lighting with gentle rim light, crisp metal highlights",
+        "style": "Photorealistic commercial advertising close-up, clean and minimal",
+        "constraints": "No people. No logos. No UI. Overlay-safe negative space.",
+    },
+)
+
+# Encoded once at import; compact separators since the model ignores whitespace.
+_HVAC_SEED_TEXT = (
+    "Refine and improve these seed specs (keep slug; keep them photorealistic; "
+    "do not introduce banned elements): "
+    + json.dumps(_HVAC_SEEDS, separators=(",", ":"))
+    + " "
+)
+
+
 def _format_prefix(format_hint: str, *, business_kind: str) -> str:
     # Keep this as prompt wording only; constraints handle the heavy lifting.
     if format_hint == "flyer":
@@ -137,95 +384,105 @@ def _format_prefix(format_hint: str, *, business_kind: str) -> str:
     return "commercial ad creative image"
 
 
-def _template_directions(business_kind: str) -> list[tuple[str, str, str]]:
-    if business_kind == "hvac":
-        return [
-            (
-                "interior_vent_airflow",
-                "Interior Vent Airflow",
-                "Clean modern living room interior with a visible ceiling or wall air vent. "
-                "Subtle cool airflow indicated by soft misty light beams (no icons). "
-                "Hero elements in lower third, strong negative space above for copy.",
-            ),
-            (
-                "outdoor_condenser",
-                "Outdoor Condenser",
-                "Clean outdoor AC condenser unit beside a modern home exterior. "
-                "Bright daylight, tidy minimal landscaping, no brand labels, no serial plates. "
-                "Condenser framed low with generous negative space above.",
-            ),
-            (
-                "register_closeup",
-                "Register Close-Up",
-                "Close-up of a clean HVAC register/vent with cool air feel (subtle condensation, gentle haze). "
-                "Minimal modern background, premium polished look, lots of negative space.",
-            ),
-            (
-                "abstract_cool_gradient",
-                "Abstract Cool Gradient",
-                "Minimal clean cool-blue to white gradient background with soft realistic shadows "
-                "and a subtle vent texture highlight (photographic, not illustration). "
-                "Designed to be overlay-friendly with lots of clean space.",
-            ),
-        ]
-    # smoothie
-    return [
-        (
-            "mango_hero_pair",
-            "Hero Pair",
-            "Two tall unbranded clear mango smoothies side-by-side with condensation. "
-            "Fresh mango slices and a few berries, bright appetizing tropical colors. "
-            "Hero composition in lower-left third, generous negative space in upper-right.",
-        ),
-        (
-            "mango_pour_splash",
-            "Pour Splash",
-            "Mango smoothie pouring into a clear cup with a clean dynamic splash arc. "
-            "Mango slices in the foreground, frozen droplets, energetic but minimal. "
-            "Action centered low, negative space in upper half.",
-        ),
-        (
-            "ingredient_flatlay",
-            "Ingredient Flatlay",
-            "Top-down flatlay of mango, citrus wedges, mint, ice, and a clear smoothie cup. "
-            "Clean modern surface, tidy geometry, editorial food styling. "
-            "Leave a large blank area for overlay text.",
-        ),
-        (
-            "tropical_counter_scene",
-            "Counter Scene",
-            "Bright modern smoothie shop counter scene with a single hero mango smoothie in a clear cup. "
-            "Clean minimal background, subtle tropical accents (no signage), airy daylight. "
-            "Leave strong negative space above the hero.",
-        ),
-        (
-            "macro_mango_texture",
-            "Macro Texture",
-            "Macro close-up of a mango smoothie surface swirl with droplets and a hint of cup rim, "
-            "plus fresh mango texture and mint nearby. "
-            "Abstract but appetizing, plenty of clean negative space.",
-        ),
-        (
-            "minimal_gradient_hero",
-            "Minimal Gradient",
-            "Single hero mango smoothie in a clear cup on a clean modern surface with a soft coral-to-mango gradient backdrop. "
-            "Premium minimal styling, strong negative space for copy.",
-        ),
-    ]
-
-
-def _style_variants(business_kind: str) -> list[tuple[str, str, str]]:
-    if business_kind == "hvac":
-        return [
-            ("bright_daylight", "Bright Daylight", "Bright natural daylight, clean crisp shadows, modern home vibe."),
-            ("cool_blue", "Cool Blue", "Cool-toned lighting with soft blue highlights, fresh and refreshing feel."),
-            ("premium_clean", "Premium Clean", "Premium commercial lighting, subtle rim light, cinematic but clean and minimal."),
-        ]
-    return [
-        ("bright_studio", "Bright Studio", "High-key studio softbox lighting, crisp highlights, clean modern look."),
-        ("sunny_window", "Sunny Window", "Natural window light, bright morning feel, gentle shadows, fresh and airy."),
-        ("premium_gloss", "Premium Gloss", "Cinematic premium commercial lighting, subtle rim light, glossy highlights, shallow depth of field."),
-    ]
+_HVAC_DIRECTIONS: tuple[tuple[str, str, str], ...] = (
+    (
+        "interior_vent_airflow",
+        "Interior Vent Airflow",
+        "Clean modern living room interior with a visible ceiling or wall air vent. "
+        "Subtle cool airflow indicated by soft misty light beams (no icons). "
+        "Hero elements in lower third, strong negative space above for copy.",
+    ),
+    (
+        "outdoor_condenser",
+        "Outdoor Condenser",
+        "Clean outdoor AC condenser unit beside a modern home exterior. "
+        "Bright daylight, tidy minimal landscaping, no brand labels, no serial plates. "
+        "Condenser framed low with generous negative space above.",
+    ),
+    (
+        "register_closeup",
+        "Register Close-Up",
+        "Close-up of a clean HVAC register/vent with cool air feel (subtle condensation, gentle haze). "
+        "Minimal modern background, premium polished look, lots of negative space.",
+    ),
+    (
+        "abstract_cool_gradient",
+        "Abstract Cool Gradient",
+        "Minimal clean cool-blue to white gradient background with soft realistic shadows "
+        "and a subtle vent texture highlight (photographic, not illustration). "
+        "Designed to be overlay-friendly with lots of clean space.",
+    ),
+)
+
+_SMOOTHIE_DIRECTIONS: tuple[tuple[str, str, str], ...] = (
+    (
+        "mango_hero_pair",
+        "Hero Pair",
+        "Two tall unbranded clear mango smoothies side-by-side with condensation. "
+        "Fresh mango slices and a few berries, bright appetizing tropical colors. "
+        "Hero composition in lower-left third, generous negative space in upper-right.",
+    ),
+    (
+        "mango_pour_splash",
+        "Pour Splash",
+        "Mango smoothie pouring into a clear cup with a clean dynamic splash arc. "
+        "Mango slices in the foreground, frozen droplets, energetic but minimal. "
+        "Action centered low, negative space in upper half.",
+    ),
+    (
+        "ingredient_flatlay",
+        "Ingredient Flatlay",
+        "Top-down flatlay of mango, citrus wedges, mint, ice, and a clear smoothie cup. "
+        "Clean modern surface, tidy geometry, editorial food styling. "
+        "Leave a large blank area for overlay text.",
+    ),
+    (
+        "tropical_counter_scene",
+        "Counter Scene",
+        "Bright modern smoothie shop counter scene with a single hero mango smoothie in a clear cup. "
+        "Clean minimal background, subtle tropical accents (no signage), airy daylight. "
+        "Leave strong negative space above the hero.",
+    ),
+    (
+        "macro_mango_texture",
+        "Macro Texture",
+        "Macro close-up of a mango smoothie surface swirl with droplets and a hint of cup rim, "
+        "plus fresh mango texture and mint nearby. "
+        "Abstract but appetizing, plenty of clean negative space.",
+    ),
+    (
+        "minimal_gradient_hero",
+        "Minimal Gradient",
+        "Single hero mango smoothie in a clear cup on a clean modern surface with a soft coral-to-mango gradient backdrop. "
+        "Premium minimal styling, strong negative space for copy.",
+    ),
+)
+
+_HVAC_STYLES: tuple[tuple[str, str, str], ...] = (
+    ("bright_daylight", "Bright Daylight", "Bright natural daylight, clean crisp shadows, modern home vibe."),
+    ("cool_blue", "Cool Blue", "Cool-toned lighting with soft blue highlights, fresh and refreshing feel."),
+    ("premium_clean", "Premium Clean", "Premium commercial lighting, subtle rim light, cinematic but clean and minimal."),
+)
+
+_SMOOTHIE_STYLES: tuple[tuple[str, str, str], ...] = (
+    ("bright_studio", "Bright Studio", "High-key studio softbox lighting, crisp highlights, clean modern look."),
+    ("sunny_window", "Sunny Window", "Natural window light, bright morning feel, gentle shadows, fresh and airy."),
+    ("premium_gloss", "Premium Gloss", "Cinematic premium commercial lighting, subtle rim light, glossy highlights, shallow depth of field."),
+)
+
+# Direction x style products, materialized once at import. For HVAC we prefer
+# diverse concepts first (styles outer); for smoothies, lighting variants per
+# concept are more useful (directions outer).
+_HVAC_TEMPLATE_COMBOS: tuple[tuple[str, str, str], ...] = tuple(
+    (f"{d_slug}__{v_slug}", f"{d_title} / {v_title}", f"{direction} {variant}")
+    for v_slug, v_title, variant in _HVAC_STYLES
+    for d_slug, d_title, direction in _HVAC_DIRECTIONS
+)
+_SMOOTHIE_TEMPLATE_COMBOS: tuple[tuple[str, str, str], ...] = tuple(
+    (f"{d_slug}__{v_slug}", f"{d_title} / {v_title}", f"{direction} {variant}")
+    for d_slug, d_title, direction in _SMOOTHIE_DIRECTIONS
+    for v_slug, v_title, variant in _SMOOTHIE_STYLES
+)
 
 
 def build_template_prompts(
@@ -242,9 +499,6 @@ def build_template_prompts(
         business_kind=business_kind, text_mode=text_mode, business_name=business_name, offer=offer
     )
     neg = base_negative_prompt(business_kind=business_kind, text_mode=text_mode)
-
-    directions = _template_directions(business_kind)
-    style_variants = _style_variants(business_kind)
     format_prefix = _format_prefix(format_hint, business_kind=business_kind)
 
     base = (
@@ -253,54 +507,22 @@ def build_template_prompts(
         f"Product: {product}. "
     )
 
-    specs: list[PromptSpec] = []
-    # For HVAC, we prefer diverse concepts first; for smoothies, lighting/style variants
-    # per concept are useful.
-    if business_kind == "hvac":
-        for v_slug, v_title, variant in style_variants:
-            for d_slug, d_title, direction in directions:
-                slug = f"{d_slug}__{v_slug}"
-                title = f"{d_title} / {v_title}"
-                prompt = f"{base}{direction} {variant} {constraints}"
-                specs.append(
-                    PromptSpec(
-                        slug=slug,
-                        title=title,
-                        prompt=prompt,
-                        negative_prompt=neg,
-                        text_mode=text_mode,
-                        format_hint=format_hint,
-                        business_kind=business_kind,
-                        business_name=business_name,
-                        offer=offer,
-                        product=product,
-                    )
-                )
-                if len(specs) >= count:
-                    return specs
-    else:
-        for d_slug, d_title, direction in directions:
-            for v_slug, v_title, variant in style_variants:
-                slug = f"{d_slug}__{v_slug}"
-                title = f"{d_title} / {v_title}"
-                prompt = f"{base}{direction} {variant} {constraints}"
-                specs.append(
-                    PromptSpec(
-                        slug=slug,
-                        title=title,
-                        prompt=prompt,
-                        negative_prompt=neg,
-                        text_mode=text_mode,
-                        format_hint=format_hint,
-                        business_kind=business_kind,
-                        business_name=business_name,
-                        offer=offer,
-                        product=product,
-                    )
-                )
-                if len(specs) >= count:
-                    return specs
-    return specs
+    combos = _HVAC_TEMPLATE_COMBOS if business_kind == "hvac" else _SMOOTHIE_TEMPLATE_COMBOS
+    return [
+        PromptSpec(
+            slug=slug,
+            title=title,
+            prompt=f"{base}{fragment} {constraints}",
+            negative_prompt=neg,
+            text_mode=text_mode,
+            format_hint=format_hint,
+            business_kind=business_kind,
+            business_name=business_name,
+            offer=offer,
+            product=product,
+        )
+        for slug, title, fragment in combos[:count]
+    ]
 
 
 def build_llm_prompts(
@@ -312,8 +534,23 @@ def build_llm_prompts(
     text_mode: str,
     format_hint: str,
     count: int,
+    use_batch_api: bool = False,
+    use_cache: bool = True,
 ) -> list[PromptSpec]:
-    llm = build_llm_clients()
+    cache_path = _spec_cache_path(
+        business_kind=business_kind,
+        business_name=business_name,
+        offer=offer,
+        product=product,
+        text_mode=text_mode,
+        format_hint=format_hint,
+        count=count,
+    )
+    if use_cache:
+        cached = _load_cached_specs(cache_path, count)
+        if cached is not None:
+            return cached
+
     constraints = base_constraints(
         business_kind=business_kind, text_mode=text_mode, business_name=business_name, offer=offer
     )
@@ -331,36 +568,17 @@ def build_llm_prompts(
             ).lower()
             constraints_text = str(item.get("constraints", "") or "").lower()
 
-            banned_phrases_anywhere = [
-                "sticker",
-                "watermark",
-                "graph",
-                "chart",
-                "diagram",
-                "infographic",
-                "thermostat",
-                "placeholder",
-                "badge",
-                "seal",
-                "corner logo",
-                "text placeholder",
-                "logo sticker",
-                "logo in corner",
-                "company logo",
-            ]
-            if any(tok in pos_text for tok in banned_phrases_anywhere):
+            if _HVAC_BANNED_ANYWHERE_RE.search(pos_text):
                 return False
-            if any(tok in constraints_text for tok in ["logo in corner", "logo sticker", "company logo"]):
+            if _HVAC_BANNED_CONSTRAINTS_RE.search(constraints_text):
                 return False
 
             # Disallow positive "illustration/icon" vibes in the main fields. Allow negations in constraints.
-            banned_positive_tokens = ["illustration", "icon", "ui", "infographic", "diagram", "graph", "chart"]
-            if any(tok in pos_text for tok in banned_positive_tokens):
+            if _HVAC_BANNED_POSITIVE_RE.search(pos_text):
                 return False
 
             # If constraints mention these, they must be in a negative form.
-            soft_banned = ["logo", "icons", "icon", "illustration", "diagram", "graph", "ui", "thermostat", "text"]
-            for tok in soft_banned:
+            for tok in _HVAC_SOFT_BANNED_TOKENS:
                 if tok not in constraints_text:
                     continue
                 if f"no {tok}" in constraints_text or f"avoid {tok}" in constraints_text:
@@ -371,117 +589,122 @@ def build_llm_prompts(
                 return False
         return True
 
-    def _ascii_title(value: str) -> str:
-        # Keep filenames/UI clean; prompt content is what matters.
-        clean = "".join(ch for ch in value if ch in string.printable).strip()
-        return " ".join(clean.split())
-
-    schema_example = (
-        "["
-        "{"
-        "\"slug\":\"mango_hero_pair\","
-        "\"title\":\"Mango Hero Pair\","
-        "\"subject\":\"Two clear mango smoothies with condensation\","
-        "\"scene\":\"Clean tropical prep surface with mango slices and mint\","
-        "\"composition\":\"Portrait 6x9, hero in lower-left, large negative space upper-right\","
-        "\"lighting\":\"Bright studio softbox, crisp highlights\","
-        "\"style\":\"Photorealistic commercial food photography, modern\","
-        "\"constraints\":\"No people. No branding. Overlay-safe negative space.\""
-        "}"
-        "]"
+    # Skeleton cache hit: reuse the model's structural output and stitch in the
+    # current business strings locally instead of calling the LLM again.
+    skeleton_path = _skeleton_cache_path(
+        business_kind=business_kind, text_mode=text_mode, format_hint=format_hint
     )
+    data: list | None = None
+    if use_cache:
+        skeleton_items = _load_cached_skeletons(skeleton_path, count)
+        if skeleton_items is not None:
+            data = [
+                _instantiate_skeleton(
+                    item, business_name=business_name, offer=offer, product=product
+                )
+                for item in skeleton_items
+            ]
 
-    hvac_concepts = (
-        "HVAC concept options (pick from these; do not invent diagrams/graphs/UI): "
-        "1) Clean modern living room with a visible vent and subtle cool airflow. "
-        "2) Outdoor AC condenser beside a modern home exterior (no labels/plates). "
-        "3) Close-up of a clean HVAC register/vent with premium lighting. "
-        "4) Abstract cool-blue photographic gradient background with realistic shadows (no icons)."
-    )
-    vertical_extra = (hvac_concepts + " ") if business_kind == "hvac" else ""
-
-    # For HVAC we get better compliance by asking the model to refine safe seeds rather than inventing
-    # infographic-like concepts (graphs, icons, thermostats, etc).
-    seeds = None
-    if business_kind == "hvac":
-        seeds = [
-            {
-                "slug": "interior_vent_airflow",
-                "title": "Interior Vent Airflow",
-                "subject": "Clean modern living room with a visible air vent",
-                "scene": "Minimal contemporary home interior, tidy surfaces, cool air feel",
-                "composition": "Portrait 6x9; vent/hero in lower third; large clean negative space in upper half for overlay copy",
-                "lighting": "Bright natural daylight with soft shadows, crisp highlights",
-                "style": "Photorealistic commercial advertising photography, premium and clean",
-                "constraints": "No people. No branding. No tools in use. Overlay-safe negative space.",
-            },
-            {
-                "slug": "outdoor_condenser",
-                "title": "Outdoor Condenser",
-                "subject": "Clean outdoor AC condenser unit",
-                "scene": "Modern home exterior in bright daylight, minimal landscaping, no labels or plates",
-                "composition": "Portrait 6x9; condenser framed low; generous negative space above for overlay copy",
-                "lighting": "Sunny daylight, soft controlled shadows, high clarity",
-                "style": "Photorealistic commercial service ad photography, modern and trustworthy",
-                "constraints": "No people. No vehicles. No branding. Overlay-safe negative space.",
-            },
-            {
-                "slug": "register_closeup",
-                "title": "Register Close-Up",
-                "subject": "Close-up of a clean HVAC register/vent",
-                "scene": "Minimal modern interior background, subtle cool haze (not icons) to imply airflow",
-                "composition": "Portrait 6x9; register in lower-left; clean empty space top-right for overlay copy",
-                "lighting": "Premium softbox lighting with gentle rim light, crisp metal highlights",
-                "style": "Photorealistic commercial advertising close-up, clean and minimal",
-                "constraints": "No people. No logos. No UI. Overlay-safe negative space.",
-            },
-        ]
+    if data is None:
+        # Imported lazily so template-only runs never pay the openai SDK import.
+        from hyperlocal.llm_providers import build_llm_clients
+        from hyperlocal.openai_helpers import chat_json, chat_json_batch
+
+        llm = build_llm_clients()
+
+        vertical_extra = (_HVAC_CONCEPTS + " ") if business_kind == "hvac" else ""
+        seed_text = _HVAC_SEED_TEXT if business_kind == "hvac" else ""
+
+        def _request_prompt(request_count: int) -> str:
+            prompt_parts = [
+                "Generate high-quality image prompt specs for a local business promotion. ",
+                f"Return exactly {request_count} items as a JSON array. ",
+                "Each item must include keys: slug, title, subject, scene, composition, lighting, style, constraints. ",
+                f"Rules: portrait 6x9; keep prompts concise and image-model friendly. {format_instruction} ",
+                "No emojis in title. Prefer photorealistic commercial photography (not illustration). ",
+                "If smoothie: unbranded clear cups only; avoid visible blender blades/machinery; avoid weird artifacts like steam. ",
+                "If HVAC: clean modern home/HVAC context; avoid workers/uniforms/tools-in-use/vehicles; avoid thermostat UI. ",
+                "If HVAC: do not mention logos/stickers/watermarks. Do not mention icons, diagrams, charts, or illustrations. ",
+                "Do not mention text placeholders. ",
+                "Keep the scene realistic and appetizing/clean; avoid gimmicky props. ",
+                f"Business name: {business_name}. Product: {product}. Offer: {offer}. ",
+                f"Text policy: {text_mode} (overlay means no in-image text). ",
+                f"Business vertical: {business_kind}. ",
+                "For HVAC: show clean modern home/HVAC context, no workers, no uniforms, no tools in use, no vehicles. ",
+                "For smoothies: commercial food photography with unbranded clear cups. ",
+                f"Creative goal: modern, appetizing {business_kind} {format_prefix} visuals with strong negative space for copy overlay. ",
+                vertical_extra,
+                seed_text,
+                "Output format example (use this exact JSON shape, but with your own content): ",
+                _SCHEMA_EXAMPLE,
+                " ",
+                "Return JSON only, no markdown.",
+            ]
+            return "".join(prompt_parts)
 
-    seed_text = ""
-    if seeds:
-        seed_text = (
-            "Refine and improve these seed specs (keep slug; keep them photorealistic; "
-            "do not introduce banned elements): "
-            + json.dumps(seeds, indent=2)
-            + " "
-        )
+        def _request_items(request_count: int) -> list:
+            result = chat_json(
+                llm.text_client,
+                llm.text_model,
+                messages=[{"role": "user", "content": _request_prompt(request_count)}],
+            )
+            if not isinstance(result, list):
+                raise RuntimeError("Model did not return a JSON array.")
+            return result
+
+        # Large counts are split into concurrent smaller requests: each one returns
+        # faster and the batch completes in roughly one round-trip instead of count/N.
+        chunk_sizes = [_LLM_BATCH_SIZE] * (count // _LLM_BATCH_SIZE)
+        if count % _LLM_BATCH_SIZE:
+            chunk_sizes.append(count % _LLM_BATCH_SIZE)
+        if use_batch_api:
+            # Offline pricing for big runs; only meaningful against a backend that
+            # implements /v1/batches (OpenAI proper, not the local providers).
+            batches = [
+                [{"role": "user", "content": _request_prompt(n)}] for n in chunk_sizes
+            ]
+            parsed = chat_json_batch(llm.text_client, llm.text_model, batches)
+            data = [item for chunk in parsed if isinstance(chunk, list) for item in chunk]
+        elif len(chunk_sizes) == 1:
+            data = _request_items(count)
+        else:
+            with ThreadPoolExecutor(max_workers=min(4, len(chunk_sizes))) as pool:
+                data = [item for chunk in pool.map(_request_items, chunk_sizes) for item in chunk]
+
+        if use_cache:
+            _store_cached_skeletons(
+                skeleton_path,
+                [
+                    _templatize_skeleton(
+                        item, business_name=business_name, offer=offer, product=product
+                    )
+                    for item in data
+                    if isinstance(item, dict)
+                ],
+            )
 
-    prompt_parts = [
-        "Generate high-quality image prompt specs for a local business promotion. ",
-        f"Return exactly {count} items as a JSON array. ",
-        "Each item must include keys: slug, title, subject, scene, composition, lighting, style, constraints. ",
-        f"Rules: portrait 6x9; keep prompts concise and image-model friendly. {format_instruction} ",
-        "No emojis in title. Prefer photorealistic commercial photography (not illustration). ",
-        "If smoothie: unbranded clear cups only; avoid visible blender blades/machinery; avoid weird artifacts like steam. ",
-        "If HVAC: clean modern home/HVAC context; avoid workers/uniforms/tools-in-use/vehicles; avoid thermostat UI. ",
-        "If HVAC: do not mention logos/stickers/watermarks. Do not mention icons, diagrams, charts, or illustrations. ",
-        "Do not mention text placeholders. ",
-        "Keep the scene realistic and appetizing/clean; avoid gimmicky props. ",
-        f"Business name: {business_name}. Product: {product}. Offer: {offer}. ",
-        f"Text policy: {text_mode} (overlay means no in-image text). ",
-        f"Business vertical: {business_kind}. ",
-        "For HVAC: show clean modern home/HVAC context, no workers, no uniforms, no tools in use, no vehicles. ",
-        "For smoothies: commercial food photography with unbranded clear cups. ",
-        f"Creative goal: modern, appetizing {business_kind} {format_prefix} visuals with strong negative space for copy overlay. ",
-        vertical_extra,
-        seed_text,
-        "Output format example (use this exact JSON shape, but with your own content): ",
-        schema_example,
-        " ",
-        "Return JSON only, no markdown.",
-    ]
-    prompt = "".join(prompt_parts)
-    data = chat_json(llm.text_client, llm.text_model, messages=[{"role": "user", "content": prompt}])
-    if not isinstance(data, list):
-        raise RuntimeError("Model did not return a JSON array.")
+    # Identical for every item, so build the header once instead of per spec.
+    header = (
+        f"Create a {format_prefix} for \"{business_name}\". "
+        f"Promotion: {offer}. Product: {product}. "
+    )
 
     specs: list[PromptSpec] = []
+    seen_slugs: dict[str, int] = {}
     for idx, item in enumerate(data[:count]):
         if not isinstance(item, dict):
             continue
         if not _candidate_is_valid(item):
             continue
         slug = slugify(str(item.get("slug") or f"llm_{idx+1}"))
+        # Concurrent chunks answer the same request prompt, so repeated slugs
+        # are common (the HVAC seeds pin their slugs in every chunk); uniquify
+        # so the per-spec {slug}.txt files don't overwrite each other.
+        occurrence = seen_slugs.get(slug, 0) + 1
+        seen_slugs[slug] = occurrence
+        if occurrence > 1:
+            slug = f"{slug}_{occurrence}"
+            seen_slugs.setdefault(slug, 1)
         title = _ascii_title(str(item.get("title") or slug)) or slug
         subject = str(item.get("subject") or "")
         scene = str(item.get("scene") or "")
@@ -503,11 +726,7 @@ def build_llm_prompts(
             ]
             if part
         )
-        full = (
-            f"Create a {format_prefix} for \"{business_name}\". "
-            f"Promotion: {offer}. Product: {product}. "
-            f"{merged} {constraints}"
-        ).strip()
+        full = f"{header}{merged} {constraints}".strip()
 
         specs.append(
             PromptSpec(
@@ -553,7 +772,10 @@ def build_llm_prompts(
                     product=spec.product,
                 )
             )
-    return specs[:count]
+    specs = specs[:count]
+    if use_cache:
+        _store_cached_specs(cache_path, specs)
+    return specs
 
 
 def ensure_dir(path: Path) -> None:
@@ -562,16 +784,23 @@ def ensure_dir(path: Path) -> None:
 
 def save_specs(run_dir: Path, specs: list[PromptSpec]) -> None:
     ensure_dir(run_dir)
-    (run_dir / "prompts.json").write_text(
-        json.dumps([asdict(s) for s in specs], indent=2) + "\n"
-    )
-    for spec in specs:
+
+    def _write_txt(spec: PromptSpec) -> None:
         (run_dir / f"{spec.slug}.txt").write_text(spec.prompt + "\n")
 
+    # Serialize the whole array to bytes up front so prompts.json lands in
+    # a single write instead of many small encoder flushes.
+    (run_dir / "prompts.json").write_bytes(
+        orjson.dumps([s.as_dict() for s in specs], option=orjson.OPT_INDENT_2) + b"\n"
+    )
+    # The per-spec files are independent, so fan the writes out across threads
+    # instead of paying each small-file syscall round-trip sequentially.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in pool.map(_write_txt, specs):
+            pass
 
-def main() -> None:
-    load_dotenv()
 
+def main() -> None:
     parser = argparse.ArgumentParser(description="Generate ad-creative image prompts (prompt-only).")
     parser.add_argument("--engine", choices=["template", "llm"], default="template")
     parser.add_argument("--count", type=int, default=6, help="Number of prompts to generate.")
@@ -595,9 +824,21 @@ def main() -> None:
         default="smoothie_ads",
         help="Output folder under output/prompts/ (default: smoothie_ads).",
     )
+    parser.add_argument(
+        "--use-batch-api",
+        action="store_true",
+        help="Route LLM requests through the OpenAI Batch API (half cost; OpenAI provider only).",
+    )
+    parser.add_argument(
+        "--no-spec-cache",
+        action="store_true",
+        help="Skip the on-disk prompt-spec cache and force fresh LLM generation.",
+    )
     args = parser.parse_args()
 
     if args.engine == "llm":
+        # Template mode needs no credentials; only load .env when the LLM runs.
+        load_dotenv()
         specs = build_llm_prompts(
             business_kind=args.business_kind,
             business_name=args.business_name,
@@ -606,6 +847,8 @@ def main() -> None:
             text_mode=args.text_mode,
             format_hint=args.format_hint,
             count=max(1, args.count),
+            use_batch_api=args.use_batch_api,
+            use_cache=not args.no_spec_cache,
         )
     else:
         specs = build_template_prompts(
@@ -1,17 +1,10 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from dotenv import load_dotenv
 from pathlib import Path
-import sys
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from hyperlocal.config import RUNTIME_CONFIG
-from hyperlocal.image_providers import build_ollama_image_config, generate_ollama_image
+from _bootstrap import ROOT  # noqa: F401  (adds the backend root to sys.path)
 
 
 @dataclass(frozen=True)
@@ -22,90 +15,102 @@ class PromptJob:
 
 
 def timestamp() -> str:
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
-
-
-def build_base_directive() -> str:
-    return (
-        "Create a full-bleed 6x9 inch portrait flyer design WITHOUT ANY TEXT. "
-        "This should feel like a creative, modern flyer with dynamic composition, "
-        "not a postcard template. "
-        "Do NOT include any letters, numbers, words, logos, signage, labels, menus, or UI. "
-        "Do NOT create a poster, book cover, magazine, brochure, billboard, or framed mockup. "
-        "No people, faces, or hands. No product packaging or product mockups. "
-        "Design direction: asymmetrical layout, layered depth, overlapping shapes, "
-        "diagonal energy, soft gradients, and subtle textures. "
-        "Leave intentional blank zones for text overlay, but avoid rigid bands or boxed panels. "
-        "No borders, no frames, no centered template look."
-    )
-
-
-def build_jobs() -> list[PromptJob]:
-    base = build_base_directive()
-    return [
-        PromptJob(
-            slug="sunset_smoothie",
-            name="Sunset Smoothie Co.",
-            prompt=(
-                f"{base} "
-                "Theme: fresh tropical smoothie shop. "
-                "Palette: coral, mint green, sunny yellow, white. "
-                "Visuals: abstract citrus slices, soft leaf silhouettes, gentle liquid gradients, "
-                "a subtle hero image zone (no products). "
-                "Lighting: bright high-key, crisp, clean. "
-                "Avoid: cups, straws, fruit labels, menus, signage."
-            ),
+    return time.strftime("%Y%m%d_%H%M%S")
+
+
+# Pure, deterministic prompt text: built once at import instead of per call.
+BASE_DIRECTIVE = (
+    "Create a full-bleed 6x9 inch portrait flyer design WITHOUT ANY TEXT. "
+    "This should feel like a creative, modern flyer with dynamic composition, "
+    "not a postcard template. "
+    "Do NOT include any letters, numbers, words, logos, signage, labels, menus, or UI. "
+    "Do NOT create a poster, book cover, magazine, brochure, billboard, or framed mockup. "
+    "No people, faces, or hands. No product packaging or product mockups. "
+    "Design direction: asymmetrical layout, layered depth, overlapping shapes, "
+    "diagonal energy, soft gradients, and subtle textures. "
+    "Leave intentional blank zones for text overlay, but avoid rigid bands or boxed panels. "
+    "No borders, no frames, no centered template look."
+)
+
+JOBS: tuple[PromptJob, ...] = (
+    PromptJob(
+        slug="sunset_smoothie",
+        name="Sunset Smoothie Co.",
+        prompt=(
+            f"{BASE_DIRECTIVE} "
+            "Theme: fresh tropical smoothie shop. "
+            "Palette: coral, mint green, sunny yellow, white. "
+            "Visuals: abstract citrus slices, soft leaf silhouettes, gentle liquid gradients, "
+            "a subtle hero image zone (no products). "
+            "Lighting: bright high-key, crisp, clean. "
+            "Avoid: cups, straws, fruit labels, menus, signage."
         ),
-        PromptJob(
-            slug="rapidkeys_home_buyers",
-            name="RapidKeys Home Buyers",
-            prompt=(
-                f"{base} "
-                "Theme: professional real estate cash buyer. "
-                "Palette: navy, gold, white. "
-                "Visuals: subtle architectural geometry, clean lines, light stone textures, "
-                "abstract skyline shapes, a calm hero zone with minimal detail. "
-                "Lighting: neutral, polished, minimal contrast. "
-                "Avoid: houses with signs, keys, dollar symbols, or branded elements."
-            ),
+    ),
+    PromptJob(
+        slug="rapidkeys_home_buyers",
+        name="RapidKeys Home Buyers",
+        prompt=(
+            f"{BASE_DIRECTIVE} "
+            "Theme: professional real estate cash buyer. "
+            "Palette: navy, gold, white. "
+            "Visuals: subtle architectural geometry, clean lines, light stone textures, "
+            "abstract skyline shapes, a calm hero zone with minimal detail. "
+            "Lighting: neutral, polished, minimal contrast. "
+            "Avoid: houses with signs, keys, dollar symbols, or branded elements."
         ),
-        PromptJob(
-            slug="northside_plumbing_hvac",
-            name="Northside Plumbing & HVAC",
-            prompt=(
-                f"{base} "
-                "Theme: plumbing & HVAC service. "
-                "Palette: blue, red, white. "
-                "Visuals: abstract pipe arcs, metallic gradients, subtle grid pattern, "
-                "clean industrial cues, a simplified tech hero zone. "
-                "Lighting: slightly cooler, crisp and technical. "
-                "Avoid: tools, gauges, labels, or any text."
-            ),
+    ),
+    PromptJob(
+        slug="northside_plumbing_hvac",
+        name="Northside Plumbing & HVAC",
+        prompt=(
+            f"{BASE_DIRECTIVE} "
+            "Theme: plumbing & HVAC service. "
+            "Palette: blue, red, white. "
+            "Visuals: abstract pipe arcs, metallic gradients, subtle grid pattern, "
+            "clean industrial cues, a simplified tech hero zone. "
+            "Lighting: slightly cooler, crisp and technical. "
+            "Avoid: tools, gauges, labels, or any text."
         ),
-    ]
+    ),
+)
 
 
 def main() -> None:
+    from dotenv import load_dotenv
+
+    from hyperlocal.config import RUNTIME_CONFIG
+    from hyperlocal.image_providers import build_ollama_image_config, generate_ollama_images
+
     load_dotenv()
 
     config = build_ollama_image_config(
         model=RUNTIME_CONFIG.ollama_image_model,
         timeout=RUNTIME_CONFIG.ollama_image_timeout,
+        cache_dir=RUNTIME_CONFIG.ollama_image_cache_dir,
     )
 
     out_root = Path(RUNTIME_CONFIG.output_dir) / "ollama" / "flyer_plates_v2"
     out_root.mkdir(parents=True, exist_ok=True)
 
-    for job in build_jobs():
+    # One timestamp per run: per-job calls could straddle a second and scatter
+    # a single run across differently named files.
+    run_ts = timestamp()
+    image_paths: list[Path] = []
+    for job in JOBS:
         out_dir = out_root / job.slug
         out_dir.mkdir(parents=True, exist_ok=True)
-        image_path = out_dir / f"background_{timestamp()}.png"
+        image_path = out_dir / f"background_{run_ts}.png"
         print(f"Generating {job.name} -> {image_path}")
-        generate_ollama_image(
-            prompt=job.prompt,
-            output_path=str(image_path),
-            config=config,
-        )
+        image_paths.append(image_path)
+
+    # One batch call: the CLI check and scratch directory are shared, and the
+    # model stays warm between consecutive prompts.
+    generate_ollama_images(
+        prompts=[job.prompt for job in JOBS],
+        output_paths=[str(path) for path in image_paths],
+        config=config,
+    )
+    for image_path in image_paths:
         print(f"Saved: {image_path}")
 
 
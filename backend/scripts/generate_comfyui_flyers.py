@@ -25,13 +25,9 @@ Notes:
 """
 
 import argparse
-from pathlib import Path
-import sys
 from dotenv import load_dotenv
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from _bootstrap import ROOT  # noqa: F401  (adds the backend root to sys.path)
 
 from hyperlocal.comfyui_flyer_pipeline import ComfyFlyerPipeline, ComfyFlyerSettings
 from hyperlocal.schemas import BusinessDetails, CreativeBrief
@@ -85,6 +81,12 @@ def main() -> None:
     parser.add_argument("--sampler", default="dpmpp_2m_sde")
     parser.add_argument("--scheduler", default="karras")
     parser.add_argument("--denoise", type=float, default=1.0)
+    parser.add_argument(
+        "--reuse-background",
+        action="store_true",
+        help="Render one shared background for all variants (ComfyUI caches the "
+        "diffusion nodes, so only the text overlays re-run per variant).",
+    )
     args = parser.parse_args()
 
     if args.business == "hvac":
@@ -104,6 +106,7 @@ def main() -> None:
         sampler_name=args.sampler,
         scheduler=args.scheduler,
         denoise=args.denoise,
+        reuse_background=args.reuse_background,
     )
 
     pipeline = ComfyFlyerPipeline(
@@ -1,34 +1,29 @@
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-from dotenv import load_dotenv
+from functools import lru_cache
 from pathlib import Path
-import sys
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from _bootstrap import ROOT  # noqa: F401  (adds the backend root to sys.path)
 
-from hyperlocal.config import RUNTIME_CONFIG
-from hyperlocal.image_providers import build_ollama_image_config, generate_ollama_image
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Direction:
     slug: str
     title: str
     prompt: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Variant:
     slug: str
     title: str
     prompt: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class BusinessConfig:
     slug: str
     name: str
@@ -38,10 +33,14 @@ class BusinessConfig:
 
 
 def timestamp() -> str:
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return time.strftime("%Y%m%d_%H%M%S")
 
 
+@lru_cache(maxsize=None)
 def base_directive(*, allow_characters: bool, text_policy: str | None = None) -> str:
+    # Memoized so every business reuses the exact same directive string; the
+    # byte-identical shared prefix also lets the model server reuse its KV
+    # cache across consecutive prompts.
     parts = [
         "Commercial creative image, product photo style.",
         "Portrait 6x9 composition.",
@@ -185,6 +184,13 @@ def save_prompt(path: Path, prompt: str) -> None:
 
 
 def main() -> None:
+    # Deferred so the interpreter does not pay for dotenv and the
+    # provider stack (httpx et al.) until a run actually starts.
+    from dotenv import load_dotenv
+
+    from hyperlocal.config import RUNTIME_CONFIG
+    from hyperlocal.image_providers import build_ollama_image_config, generate_ollama_image
+
     load_dotenv()
 
     businesses = build_businesses()
@@ -196,27 +202,50 @@ def main() -> None:
     config = build_ollama_image_config(
         model=model,
         timeout=RUNTIME_CONFIG.ollama_image_timeout,
+        cache_dir=RUNTIME_CONFIG.ollama_image_cache_dir,
     )
 
-    for business in businesses:
-        variants = build_variants(business.focus_variant_prompt)
-        for direction in business.directions:
-            for variant in variants:
-                prompt = f"{business.base_prompt} {direction.prompt} {variant.prompt}"
-                filename = f"{business.slug}__{direction.slug}__{variant.slug}.png"
-                image_path = run_dir / filename
-                prompt_path = run_dir / f"{business.slug}__{direction.slug}__{variant.slug}.txt"
-
-                print(
-                    f"Generating {business.name} / {direction.title} / {variant.title} -> {image_path}"
-                )
-                generate_ollama_image(
-                    prompt=prompt,
-                    output_path=str(image_path),
-                    config=config,
-                )
-                save_prompt(prompt_path, prompt)
-                print(f"Saved: {image_path}")
+    jobs = [
+        (
+            f"{business.base_prompt} {direction.prompt} {variant.prompt}",
+            run_dir / f"{business.slug}__{direction.slug}__{variant.slug}.png",
+            run_dir / f"{business.slug}__{direction.slug}__{variant.slug}.txt",
+            f"{business.name} / {direction.title} / {variant.title}",
+        )
+        for business in businesses
+        for direction in business.directions
+        for variant in build_variants(business.focus_variant_prompt)
+    ]
+    # Dispatch similar-length prompts together (32-token bins): when workers
+    # overlap requests, batches of like-sized prompts waste less padding
+    # compute. Outputs are independent files, so order does not matter.
+    jobs.sort(key=lambda job: len(job[0].split()) // 32)
+
+    def run_job(job: tuple[str, Path, Path, str]) -> None:
+        prompt, image_path, prompt_path, label = job
+        print(f"Generating {label} -> {image_path}", flush=True)
+        generate_ollama_image(
+            prompt=prompt,
+            output_path=str(image_path),
+            config=config,
+        )
+        print(f"Saved: {image_path}", flush=True)
+
+    # Each job blocks on Ollama inference; with OLLAMA_WORKERS > 1 the server
+    # can overlap prefill of the next prompt with decode of the current one.
+    workers = max(1, RUNTIME_CONFIG.ollama_workers)
+    if workers == 1:
+        for job in jobs:
+            run_job(job)
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            for _ in pool.map(run_job, jobs):
+                pass
+
+    # Prompt sidecars are written after the generation phase drains so the hot
+    # loop never blocks on small file writes between dispatches.
+    for prompt, _, prompt_path, _ in jobs:
+        save_prompt(prompt_path, prompt)
 
 
 if __name__ == "__main__":
@@ -1,21 +1,19 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
-from datetime import datetime
-from dotenv import load_dotenv
-from pathlib import Path
 import sys
+import time
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 
-from hyperlocal.config import RUNTIME_CONFIG
-from hyperlocal.image_providers import build_ollama_image_config, generate_ollama_image
+from _bootstrap import ROOT  # noqa: F401  (adds the backend root to sys.path)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Direction:
     slug: str
     title: str
@@ -27,7 +25,7 @@ class Direction:
     constraints: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class BusinessConfig:
     slug: str
     name: str
@@ -35,11 +33,13 @@ class BusinessConfig:
 
 
 def timestamp() -> str:
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return time.strftime("%Y%m%d_%H%M%S")
 
 
+@lru_cache(maxsize=None)
 def build_prompt(direction: Direction) -> str:
-    # Advanced prompt formula merged into a single prompt string.
+    # Advanced prompt formula merged into a single prompt string; memoized so
+    # repeat lookups for a direction are attribute reads, not re-joins.
     sections = [
         f"Subject: {direction.subject}",
         f"Scene: {direction.scene}",
@@ -51,43 +51,45 @@ def build_prompt(direction: Direction) -> str:
     return " ".join(sections)
 
 
-def build_businesses() -> list[BusinessConfig]:
-    smoothie_constraints = (
-        "No text, logos, labels, menus, signage, watermarks, or packaging graphics. "
-        "No people, faces, or hands. Unbranded clear cups only. "
-        "No icons, illustrations, or UI elements."
-    )
-    plumbing_constraints = (
-        "Text required: exact string \"Stan & Sons Plumbing\" "
-        "(case and punctuation). Characters must be exactly: "
-        "S t a n [space] & [space] S o n s [space] P l u m b i n g. "
-        "English-only, Latin letters only, no diacritics. "
-        "Single line, plain sans-serif, high legibility, no stylization, "
-        "no ligatures, no drop shadow, no distortion. "
-        "Render on a plain white rectangular nameplate with black text, "
-        "centered, large font size, high contrast. "
-        "Place the nameplate bottom-centered only. One instance of the text. "
-        "Do not omit, replace, or add characters. "
-        "No other text, logos, labels, signage, decals, or watermarks. "
-        "No people, faces, hands, uniforms, or tools in use. "
-        "No vehicles, icons, mascots, balloons, or unrelated props."
-    )
+# Shared constraint blocks, built once at import instead of per build_businesses call.
+SMOOTHIE_CONSTRAINTS = sys.intern(
+    "No text, logos, labels, menus, signage, watermarks, or packaging graphics. "
+    "No people, faces, or hands. Unbranded clear cups only. "
+    "No icons, illustrations, or UI elements."
+)
+PLUMBING_CONSTRAINTS = sys.intern(
+    "Text required: exact string \"Stan & Sons Plumbing\" "
+    "(case and punctuation). Characters must be exactly: "
+    "S t a n [space] & [space] S o n s [space] P l u m b i n g. "
+    "English-only, Latin letters only, no diacritics. "
+    "Single line, plain sans-serif, high legibility, no stylization, "
+    "no ligatures, no drop shadow, no distortion. "
+    "Render on a plain white rectangular nameplate with black text, "
+    "centered, large font size, high contrast. "
+    "Place the nameplate bottom-centered only. One instance of the text. "
+    "Do not omit, replace, or add characters. "
+    "No other text, logos, labels, signage, decals, or watermarks. "
+    "No people, faces, hands, uniforms, or tools in use. "
+    "No vehicles, icons, mascots, balloons, or unrelated props."
+)
+
+REAL_ESTATE_CONSTRAINTS = sys.intern(
+    "Text required: exact string \"RapidKeys Home Buyers\" "
+    "(case and punctuation). Characters must be exactly: "
+    "R a p i d K e y s [space] H o m e [space] B u y e r s. "
+    "English-only, Latin letters only, no diacritics. "
+    "Single line, plain sans-serif, high legibility, no stylization, "
+    "no ligatures, no drop shadow, no distortion. "
+    "Render on a plain white rectangular nameplate with black text, "
+    "centered, large font size, high contrast. "
+    "Place the nameplate bottom-centered only. One instance of the text. "
+    "Do not omit, replace, or add characters. "
+    "No other text, logos, labels, signage, decals, or watermarks. "
+    "No people, faces, or hands. No vehicles."
+)
 
-    real_estate_constraints = (
-        "Text required: exact string \"RapidKeys Home Buyers\" "
-        "(case and punctuation). Characters must be exactly: "
-        "R a p i d K e y s [space] H o m e [space] B u y e r s. "
-        "English-only, Latin letters only, no diacritics. "
-        "Single line, plain sans-serif, high legibility, no stylization, "
-        "no ligatures, no drop shadow, no distortion. "
-        "Render on a plain white rectangular nameplate with black text, "
-        "centered, large font size, high contrast. "
-        "Place the nameplate bottom-centered only. One instance of the text. "
-        "Do not omit, replace, or add characters. "
-        "No other text, logos, labels, signage, decals, or watermarks. "
-        "No people, faces, or hands. No vehicles."
-    )
 
+def build_businesses() -> list[BusinessConfig]:
     return [
         BusinessConfig(
             slug="smoothie",
@@ -104,7 +106,7 @@ def build_businesses() -> list[BusinessConfig]:
                     ),
                     lighting="High-key studio softbox with gentle rim light and crisp highlights.",
                     style="Photorealistic commercial food photography, clean, appetizing, vivid.",
-                    constraints=smoothie_constraints,
+                    constraints=SMOOTHIE_CONSTRAINTS,
                 ),
                 Direction(
                     slug="pour_splash",
@@ -116,7 +118,7 @@ def build_businesses() -> list[BusinessConfig]:
                     ),
                     lighting="Crisp studio lighting, motion frozen, sparkling droplets.",
                     style="Photorealistic advertising shot, sharp detail, energetic.",
-                    constraints=smoothie_constraints,
+                    constraints=SMOOTHIE_CONSTRAINTS,
                 ),
             ],
         ),
@@ -138,7 +140,7 @@ def build_businesses() -> list[BusinessConfig]:
                         "Photorealistic real-estate advertising hero image, "
                         "trustworthy and professional."
                     ),
-                    constraints=real_estate_constraints,
+                    constraints=REAL_ESTATE_CONSTRAINTS,
                 ),
                 Direction(
                     slug="front_door",
@@ -153,7 +155,7 @@ def build_businesses() -> list[BusinessConfig]:
                     style=(
                         "Photorealistic advertising hero image, calm and premium."
                     ),
-                    constraints=real_estate_constraints,
+                    constraints=REAL_ESTATE_CONSTRAINTS,
                 ),
             ],
         ),
@@ -178,7 +180,7 @@ def build_businesses() -> list[BusinessConfig]:
                         "Photorealistic service advertisement, premium and trustworthy, "
                         "not a catalog product shot. Heroic composition, ad-like polish."
                     ),
-                    constraints=plumbing_constraints,
+                    constraints=PLUMBING_CONSTRAINTS,
                 ),
                 Direction(
                     slug="faucet_detail",
@@ -199,7 +201,7 @@ def build_businesses() -> list[BusinessConfig]:
                         "Photorealistic advertising hero image, clean and modern, "
                         "not a catalog product shot. Heroic composition, ad-like polish."
                     ),
-                    constraints=plumbing_constraints,
+                    constraints=PLUMBING_CONSTRAINTS,
                 ),
             ],
         ),
@@ -209,25 +211,37 @@ def build_businesses() -> list[BusinessConfig]:
 def resolve_businesses(target: str, businesses: list[BusinessConfig]) -> list[BusinessConfig]:
     if target == "all":
         return businesses
-    selected = [b for b in businesses if b.slug == target]
-    if not selected:
-        raise ValueError(f"Unknown business '{target}'. Options: all, " + ", ".join(b.slug for b in businesses))
-    return selected
+    by_slug = {b.slug: b for b in businesses}
+    if target not in by_slug:
+        raise ValueError(
+            f"Unknown business '{target}'. Options: all, " + ", ".join(by_slug)
+        )
+    return [by_slug[target]]
 
 
 def resolve_directions(target: str | None, directions: list[Direction]) -> list[Direction]:
     if not target:
         return directions
-    requested = {slug.strip() for slug in target.split(",") if slug.strip()}
-    selected = [d for d in directions if d.slug in requested]
-    if not selected:
+    # Dedupe while keeping the user-specified order so run output is
+    # reproducible from the CLI invocation.
+    requested = list(dict.fromkeys(slug.strip() for slug in target.split(",") if slug.strip()))
+    by_slug = {d.slug: d for d in directions}
+    unknown = [slug for slug in requested if slug not in by_slug]
+    if unknown:
         raise ValueError(
-            "Unknown direction(s). Options: " + ", ".join(d.slug for d in directions)
+            "Unknown direction(s): " + ", ".join(unknown)
+            + ". Options: " + ", ".join(by_slug)
         )
-    return selected
+    return [by_slug[slug] for slug in requested]
 
 
 def main() -> None:
+    # Heavy imports live here so --help stays instant.
+    from dotenv import load_dotenv
+
+    from hyperlocal.config import RUNTIME_CONFIG
+    from hyperlocal.image_providers import build_ollama_image_config, generate_ollama_image
+
     load_dotenv()
 
     parser = argparse.ArgumentParser(
@@ -258,24 +272,47 @@ def main() -> None:
     config = build_ollama_image_config(
         model=args.model,
         timeout=RUNTIME_CONFIG.ollama_image_timeout,
+        cache_dir=RUNTIME_CONFIG.ollama_image_cache_dir,
     )
 
-    for business in businesses:
-        directions = resolve_directions(args.direction, business.directions)
-        for direction in directions:
-            prompt = build_prompt(direction)
-            filename = f"{business.slug}__{direction.slug}.png"
-            image_path = run_dir / filename
-            prompt_path = run_dir / f"{business.slug}__{direction.slug}.txt"
-
-            print(f"Generating {business.name} / {direction.title} -> {image_path}")
-            generate_ollama_image(
-                prompt=prompt,
-                output_path=str(image_path),
-                config=config,
-            )
-            prompt_path.write_text(prompt)
-            print(f"Saved: {image_path}")
+    jobs = [
+        (
+            f"{business.slug}__{direction.slug}",
+            build_prompt(direction),
+            run_dir / f"{business.slug}__{direction.slug}.png",
+            f"{business.name} / {direction.title}",
+        )
+        for business in businesses
+        for direction in resolve_directions(args.direction, business.directions)
+    ]
+
+    def run_job(job: tuple[str, str, Path, str]) -> None:
+        _, prompt, image_path, label = job
+        print(f"Generating {label} -> {image_path}", flush=True)
+        generate_ollama_image(
+            prompt=prompt,
+            output_path=str(image_path),
+            config=config,
+        )
+        print(f"Saved: {image_path}", flush=True)
+
+    # OLLAMA_WORKERS > 1 overlaps HTTP round-trips and PNG writes with the
+    # server's compute on queued prompts; default stays sequential.
+    workers = max(1, RUNTIME_CONFIG.ollama_workers)
+    if workers == 1:
+        for job in jobs:
+            run_job(job)
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            for _ in pool.map(run_job, jobs):
+                pass
+
+    # One manifest instead of a .txt sidecar per image: all prompts are known
+    # up front, so a single write covers the whole run.
+    manifest = {key: prompt for key, prompt, _, _ in jobs}
+    (run_dir / "prompts.json").write_bytes(
+        orjson.dumps(manifest, option=orjson.OPT_INDENT_2) + b"\n"
+    )
 
 
 if __name__ == "__main__":
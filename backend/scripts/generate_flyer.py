@@ -1,12 +1,8 @@
 from __future__ import annotations
 
 from dotenv import load_dotenv
-from pathlib import Path
-import sys
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from _bootstrap import ROOT  # noqa: F401  (adds the backend root to sys.path)
 
 from hyperlocal.pipeline import FlyerPipeline
 from hyperlocal.schemas import (
@@ -124,8 +120,11 @@ def main() -> None:
     ]
     for brief in briefs:
         name = brief.business_details.name if brief.business_details else "Unknown Business"
-        print(f"Generating: {name}")
-        result = pipeline.run(brief)
+        print(f"Queued: {name}")
+    # run_batch overlaps copy generation for the next brief with image
+    # generation for the current one.
+    results = pipeline.run_batch(briefs)
+    for result in results:
         print(f"Run complete: {result.output_dir}")
         for variant in result.variants:
             status = "PASS" if variant.qc_passed else "FAIL"
@@ -1,17 +1,12 @@
 from __future__ import annotations
 
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-from dotenv import load_dotenv
 from pathlib import Path
-import sys
-
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
 
-from hyperlocal.config import RUNTIME_CONFIG
-from hyperlocal.image_providers import build_ollama_image_config, generate_ollama_image
+from _bootstrap import ROOT  # noqa: F401  (adds the backend root to sys.path)
 
 
 @dataclass(frozen=True)
@@ -22,12 +17,12 @@ class PromptSpec:
 
 
 def timestamp() -> str:
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return time.strftime("%Y%m%d_%H%M%S")
 
 
 BUSINESS_NAME = "SunPeak HVAC"
 PROMO_TEXT = "20% OFF AC TUNING"
-TEXT_RULES = (
+TEXT_RULES = sys.intern(
     f"Text required: exact strings \"{BUSINESS_NAME}\" and \"{PROMO_TEXT}\" only. "
     "Two lines, plain sans-serif, high legibility, no stylization, no distortion. "
     "Bottom-centered, high contrast on clean background. "
@@ -72,6 +67,11 @@ def save_prompt(path: Path, prompt: str) -> None:
 
 
 def main() -> None:
+    from dotenv import load_dotenv
+
+    from hyperlocal.config import RUNTIME_CONFIG
+    from hyperlocal.image_providers import build_ollama_image_config, generate_ollama_image
+
     load_dotenv()
 
     run_dir = (
@@ -82,20 +82,27 @@ def main() -> None:
     config = build_ollama_image_config(
         model="x/flux2-klein:latest",
         timeout=RUNTIME_CONFIG.ollama_image_timeout,
+        cache_dir=RUNTIME_CONFIG.ollama_image_cache_dir,
     )
 
     prompts = [build_simple_prompt_1(), build_simple_prompt_2()]
-    for spec in prompts:
+    def run_spec(spec: PromptSpec) -> None:
         image_path = run_dir / f"hvac__{spec.slug}.png"
         prompt_path = run_dir / f"hvac__{spec.slug}.txt"
-        print(f"Generating HVAC / {spec.title} -> {image_path}")
+        print(f"Generating HVAC / {spec.title} -> {image_path}", flush=True)
         generate_ollama_image(
             prompt=spec.prompt,
             output_path=str(image_path),
             config=config,
         )
         save_prompt(prompt_path, spec.prompt)
-        print(f"Saved: {image_path}")
+        print(f"Saved: {image_path}", flush=True)
+
+    # Both prompts dispatch together so the second is queued on the server
+    # while the first decodes, instead of idling between the two calls.
+    with ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+        for _ in pool.map(run_spec, prompts):
+            pass
 
 
 if __name__ == "__main__":
@@ -1,17 +1,12 @@
 from __future__ import annotations
 
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-from dotenv import load_dotenv
 from pathlib import Path
-import sys
-
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
 
-from hyperlocal.config import RUNTIME_CONFIG
-from hyperlocal.image_providers import build_ollama_image_config, generate_ollama_image
+from _bootstrap import ROOT  # noqa: F401  (adds the backend root to sys.path)
 
 
 @dataclass(frozen=True)
@@ -23,7 +18,7 @@ class PromptSpec:
 
 BUSINESS_NAME = "Sunset Smoothie Co."
 OFFER_TEXT = "BUY 1 GET 1 FREE MANGO SMOOTHIES"
-TEXT_RULES = (
+TEXT_RULES = sys.intern(
     f"Text required: exact strings \"{BUSINESS_NAME}\" and "
     f"\"{OFFER_TEXT}\" only. Two lines only. Characters must be exactly: "
     "S u n s e t [space] S m o o t h i e [space] C o . "
@@ -37,7 +32,7 @@ TEXT_RULES = (
 
 
 def timestamp() -> str:
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return time.strftime("%Y%m%d_%H%M%S")
 
 
 def build_prompt_1() -> PromptSpec:
@@ -79,6 +74,11 @@ def save_prompt(path: Path, prompt: str) -> None:
 
 
 def main() -> None:
+    from dotenv import load_dotenv
+
+    from hyperlocal.config import RUNTIME_CONFIG
+    from hyperlocal.image_providers import build_ollama_image_config, generate_ollama_image
+
     load_dotenv()
 
     run_dir = (
@@ -89,20 +89,27 @@ def main() -> None:
     config = build_ollama_image_config(
         model="x/flux2-klein:latest",
         timeout=RUNTIME_CONFIG.ollama_image_timeout,
+        cache_dir=RUNTIME_CONFIG.ollama_image_cache_dir,
     )
 
     prompts = [build_prompt_1(), build_prompt_2()]
-    for spec in prompts:
+    def run_spec(spec: PromptSpec) -> None:
         image_path = run_dir / f"smoothie__{spec.slug}.png"
         prompt_path = run_dir / f"smoothie__{spec.slug}.txt"
-        print(f"Generating Smoothie / {spec.title} -> {image_path}")
+        print(f"Generating Smoothie / {spec.title} -> {image_path}", flush=True)
         generate_ollama_image(
             prompt=spec.prompt,
             output_path=str(image_path),
             config=config,
         )
         save_prompt(prompt_path, spec.prompt)
-        print(f"Saved: {image_path}")
+        print(f"Saved: {image_path}", flush=True)
+
+    # Both prompts dispatch together so the second is queued on the server
+    # while the first decodes, instead of idling between the two calls.
+    with ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+        for _ in pool.map(run_spec, prompts):
+            pass
 
 
 if __name__ == "__main__":
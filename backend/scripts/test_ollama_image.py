@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import os
 import shutil
-import subprocess
 import sys
 from pathlib import Path
 
@@ -39,6 +40,15 @@ def parse_args() -> argparse.Namespace:
         default="output/ollama",
         help="Directory to write images under (relative to repo root).",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=1,
+        help=(
+            "How many models to run at once. Default 1 (safe on a single GPU); "
+            "raise it when the server can hold several models resident."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -65,36 +75,47 @@ def normalize_prompts(models: list[str], prompts: list[str] | None) -> list[str]
     return prompts
 
 
-def collect_image_files(directory: Path) -> set[Path]:
-    return {p for p in directory.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES}
+def collect_image_files(directory: Path) -> dict[Path, int]:
+    # os.scandir serves suffix and mtime from one directory pass, so callers
+    # can sort new files without a second stat() per entry.
+    with os.scandir(directory) as entries:
+        return {
+            Path(entry.path): entry.stat().st_mtime_ns
+            for entry in entries
+            if Path(entry.name).suffix.lower() in IMAGE_SUFFIXES
+        }
 
 
-def run_model(model: str, prompt: str, out_dir: Path) -> int:
+async def run_model(
+    model: str, prompt: str, out_dir: Path, semaphore: asyncio.Semaphore
+) -> int:
     model_dir = out_dir / model.replace("/", "_")
     model_dir.mkdir(parents=True, exist_ok=True)
 
     before = collect_image_files(model_dir)
 
     cmd = ["ollama", "run", model, prompt]
-    print(f"\nRunning: {' '.join(cmd)}")
-    result = subprocess.run(
-        cmd,
-        cwd=model_dir,
-        text=True,
-        capture_output=True,
-    )
+    async with semaphore:
+        print(f"\nRunning: {' '.join(cmd)}")
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=model_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
 
-    if result.stdout:
-        print(result.stdout.rstrip())
-    if result.stderr:
-        print(result.stderr.rstrip(), file=sys.stderr)
+    if stdout:
+        print(stdout.decode().rstrip())
+    if stderr:
+        print(stderr.decode().rstrip(), file=sys.stderr)
 
-    if result.returncode != 0:
-        print(f"Command failed with exit code {result.returncode}.", file=sys.stderr)
-        return result.returncode
+    if proc.returncode != 0:
+        print(f"Command failed with exit code {proc.returncode}.", file=sys.stderr)
+        return proc.returncode or 1
 
     after = collect_image_files(model_dir)
-    new_images = sorted(after - before, key=lambda p: p.stat().st_mtime)
+    new_images = sorted(after.keys() - before.keys(), key=after.__getitem__)
     if new_images:
         latest = new_images[-1].relative_to(REPO_ROOT)
         print(f"Saved image: {latest}")
@@ -121,12 +142,20 @@ def main() -> None:
         out_dir = REPO_ROOT / out_dir
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    exit_code = 0
-    for model, prompt in zip(models, prompts):
-        code = run_model(model, prompt, out_dir)
-        if code != 0:
-            exit_code = code
-    sys.exit(exit_code)
+    async def run_all() -> int:
+        # All runs are scheduled together; the semaphore decides how many
+        # actually overlap, so --max-concurrency 1 preserves the old serial
+        # behavior while still reusing one event loop.
+        semaphore = asyncio.Semaphore(max(1, args.max_concurrency))
+        codes = await asyncio.gather(
+            *(
+                run_model(model, prompt, out_dir, semaphore)
+                for model, prompt in zip(models, prompts)
+            )
+        )
+        return next((code for code in codes if code != 0), 0)
+
+    sys.exit(asyncio.run(run_all()))
 
 
 if __name__ == "__main__":
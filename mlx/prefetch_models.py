@@ -3,10 +3,9 @@ from __future__ import annotations
 
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from huggingface_hub import snapshot_download
-
 DEFAULT_MODELS = [
     "mlx-community/Llama-3.2-3B-Instruct-4bit",
     "mlx-community/Qwen3-VL-4B-Instruct-3bit",
@@ -29,13 +28,16 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    # Imported after argparse so --help stays instant.
+    from huggingface_hub import snapshot_download
+
     cache_dir = Path(args.cache_dir).expanduser() if args.cache_dir else None
 
     print("HF transfer:", os.getenv("HF_HUB_ENABLE_HF_TRANSFER", "0"))
     print("HF cache:", cache_dir or "default")
 
-    for repo in args.models:
-        print(f"\n==> Downloading {repo}")
+    def fetch(repo: str) -> None:
+        print(f"==> Downloading {repo}")
         snapshot_download(
             repo_id=repo,
             revision=args.revision,
@@ -44,6 +46,11 @@ def main() -> int:
         )
         print(f"Done: {repo}")
 
+    # Download repos concurrently; the metadata/handshake phases overlap so
+    # wall clock tracks the largest repo instead of the sum.
+    with ThreadPoolExecutor(max_workers=min(4, len(args.models))) as pool:
+        list(pool.map(fetch, args.models))
+
     return 0
 
 
@@ -3,10 +3,9 @@ from __future__ import annotations
 
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from huggingface_hub import hf_hub_download
-
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -19,8 +18,9 @@ def main() -> None:
     )
     parser.add_argument(
         "--filename",
-        default="sd_xl_base_1.0.safetensors",
-        help="Checkpoint filename to download",
+        nargs="+",
+        default=["sd_xl_base_1.0.safetensors"],
+        help="One or more checkpoint filenames to download",
     )
     parser.add_argument(
         "--out-dir",
@@ -29,21 +29,30 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    # Imported after argparse so --help stays instant.
+    from huggingface_hub import hf_hub_download
+
     out_dir = Path(args.out_dir).resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
 
     # Enable hf_transfer for fast downloads if installed.
     os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
 
-    print(f"Downloading {args.repo}:{args.filename}")
     print(f"Destination: {out_dir}")
-    path = hf_hub_download(
-        repo_id=args.repo,
-        filename=args.filename,
-        local_dir=str(out_dir),
-        local_dir_use_symlinks=False,
-    )
-    print(f"Downloaded to: {path}")
+
+    def fetch(filename: str) -> str:
+        print(f"Downloading {args.repo}:{filename}")
+        return hf_hub_download(
+            repo_id=args.repo,
+            filename=filename,
+            local_dir=str(out_dir),
+            local_dir_use_symlinks=False,
+        )
+
+    # Multiple files (base + VAE + refiner) download concurrently.
+    with ThreadPoolExecutor(max_workers=min(4, len(args.filename))) as pool:
+        for path in pool.map(fetch, args.filename):
+            print(f"Downloaded to: {path}")
 
 
 if __name__ == "__main__":